@@ -22,7 +22,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 import numpy as np
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 # Audio processing libraries with fallbacks
 try:
@@ -488,96 +489,129 @@ class AudioAnalysisEngine:
         file_path = str(Path(file_path).resolve())
         
         # Check cache first
-        if use_cache and self.cache_enabled:
-            with self._cache_lock:
-                if file_path in self._analysis_cache:
-                    cached_result = self._analysis_cache[file_path]
-                    # Check if cache is still valid (24 hours)
-                    if time.time() - cached_result.analysis_time < 86400:
-                        return cached_result
+        if use_cache:
+            cached_result = self._get_cached_result(file_path)
+            if cached_result is not None:
+                return cached_result
         
         try:
-            # Basic file validation
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Audio file not found: {file_path}")
-            
-            if not self._is_audio_file(file_path):
-                raise ValueError(f"File is not a supported audio format: {file_path}")
-            
-            # Perform analysis
-            start_time = time.time()
-            
-            if isinstance(self.analyzer, AdvancedLibrosaAnalyzer):
-                analysis_data = self.analyzer.analyze_audio(file_path)
-            else:
-                # Basic FFmpeg analysis
-                analysis_data = self.analyzer.analyze_audio(file_path)
-                content_type = self.analyzer.detect_content_type(file_path)
-                analysis_data["content_type"] = content_type
-                analysis_data["confidence"] = 0.5
-                analysis_data["quality"] = AudioQuality.FAIR
-                analysis_data["features"] = AudioFeatures()
-            
-            if not analysis_data:
-                return None
-            
-            # Create comprehensive result
-            result = self._create_analysis_result(file_path, analysis_data)
-            
-            # Cache result
-            if use_cache and self.cache_enabled:
-                with self._cache_lock:
-                    # Clean cache if too large
-                    if len(self._analysis_cache) >= self.max_cache_size:
-                        # Remove oldest entries
-                        oldest_keys = sorted(
-                            self._analysis_cache.keys(),
-                            key=lambda k: self._analysis_cache[k].analysis_time
-                        )[:len(self._analysis_cache) - self.max_cache_size + 10]
-                        for key in oldest_keys:
-                            del self._analysis_cache[key]
-                    
-                    self._analysis_cache[file_path] = result
-            
-            # Publish event
-            if self.event_publisher:
-                self.event_publisher.publish_event(
-                    "audio.analyzed",
-                    {
-                        "file_path": file_path,
-                        "content_type": result.content_type.value,
-                        "quality": result.quality.value,
-                        "duration": result.duration,
-                        "analyzer": self.analyzer_name
-                    },
-                    "AudioAnalysisEngine"
-                )
-            
-            return result
-            
+            result = self._run_analysis(file_path)
         except Exception as e:
-            logging.error(f"Audio analysis failed for {file_path}: {e}")
-            
-            if self.event_publisher:
-                self.event_publisher.publish_event(
-                    "audio.analysis_failed",
-                    {
-                        "file_path": file_path,
-                        "error": str(e)
-                    },
-                    "AudioAnalysisEngine"
-                )
-            
+            self._report_analysis_failure(file_path, e)
+            return None
+        
+        if result is not None:
+            self._record_analysis(file_path, result, use_cache)
+        return result
+
+    def _run_analysis(self, file_path: str) -> Optional[AudioAnalysisResult]:
+        """Analyze a resolved file path without touching the cache or publishing events"""
+        # Basic file validation
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Audio file not found: {file_path}")
+        
+        if not self._is_audio_file(file_path):
+            raise ValueError(f"File is not a supported audio format: {file_path}")
+        
+        # Perform analysis
+        if isinstance(self.analyzer, AdvancedLibrosaAnalyzer):
+            analysis_data = self.analyzer.analyze_audio(file_path)
+        else:
+            # Basic FFmpeg analysis
+            analysis_data = self.analyzer.analyze_audio(file_path)
+            content_type = self.analyzer.detect_content_type(file_path)
+            analysis_data["content_type"] = content_type
+            analysis_data["confidence"] = 0.5
+            analysis_data["quality"] = AudioQuality.FAIR
+            analysis_data["features"] = AudioFeatures()
+        
+        if not analysis_data:
             return None
+        
+        # Create comprehensive result
+        return self._create_analysis_result(file_path, analysis_data)
+
+    def _get_cached_result(self, file_path: str) -> Optional[AudioAnalysisResult]:
+        """Return a cached result for a resolved path if caching is on and it is still valid"""
+        if not self.cache_enabled:
+            return None
+        with self._cache_lock:
+            cached_result = self._analysis_cache.get(file_path)
+        # Check if cache is still valid (24 hours)
+        if cached_result is not None and time.time() - cached_result.analysis_time < 86400:
+            return cached_result
+        return None
+
+    def _record_analysis(self, file_path: str, result: AudioAnalysisResult, use_cache: bool = True) -> None:
+        """Cache a fresh result and publish the audio.analyzed event"""
+        if use_cache and self.cache_enabled:
+            self._cache_result(file_path, result)
+        
+        if self.event_publisher:
+            self.event_publisher.publish_event(
+                "audio.analyzed",
+                {
+                    "file_path": file_path,
+                    "content_type": result.content_type.value,
+                    "quality": result.quality.value,
+                    "duration": result.duration,
+                    "analyzer": self.analyzer_name
+                },
+                "AudioAnalysisEngine"
+            )
 
-    def batch_analyze(self, file_paths: List[str], max_workers: int = 4) -> Dict[str, AudioAnalysisResult]:
-        """Analyze multiple audio files in parallel"""
+    def _report_analysis_failure(self, file_path: str, error: Exception) -> None:
+        """Log a failed analysis and publish the audio.analysis_failed event"""
+        logging.error(f"Audio analysis failed for {file_path}: {error}")
+        
+        if self.event_publisher:
+            self.event_publisher.publish_event(
+                "audio.analysis_failed",
+                {
+                    "file_path": file_path,
+                    "error": str(error)
+                },
+                "AudioAnalysisEngine"
+            )
+
+    def _cache_result(self, file_path: str, result: AudioAnalysisResult) -> None:
+        """Store an analysis result, evicting the oldest entries when full"""
+        with self._cache_lock:
+            # Clean cache if too large
+            if len(self._analysis_cache) >= self.max_cache_size:
+                # Remove oldest entries
+                oldest_keys = sorted(
+                    self._analysis_cache.keys(),
+                    key=lambda k: self._analysis_cache[k].analysis_time
+                )[:len(self._analysis_cache) - self.max_cache_size + 10]
+                for key in oldest_keys:
+                    del self._analysis_cache[key]
+            
+            self._analysis_cache[file_path] = result
+
+    def batch_analyze(self, file_paths: List[str], max_workers: int = 4,
+                      executor: str = "thread") -> Dict[str, AudioAnalysisResult]:
+        """Analyze multiple audio files in parallel
+        
+        Use executor="process" for CPU-bound analysis (librosa feature
+        extraction) so files are analyzed in separate processes instead of
+        contending for the GIL. Both executors use this engine's cache and
+        publish events on this engine's event publisher.
+        """
+        if executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            analyze = self.analyze_file
+        elif executor == "process":
+            return self._batch_analyze_in_processes(file_paths, max_workers)
+        else:
+            raise ValueError(f"Unsupported executor: {executor}")
+        
         results = {}
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with pool:
             # Submit all analysis tasks
             future_to_file = {
-                executor.submit(self.analyze_file, file_path): file_path
+                pool.submit(analyze, file_path): file_path
                 for file_path in file_paths
             }
             
@@ -593,6 +627,52 @@ class AudioAnalysisEngine:
         
         return results
 
+    def _batch_analyze_in_processes(self, file_paths: List[str],
+                                    max_workers: int) -> Dict[str, AudioAnalysisResult]:
+        """Analyze uncached files in worker processes; caching and events stay in this process"""
+        results = {}
+        pending: Dict[str, str] = {}
+        
+        for file_path in file_paths:
+            resolved_path = str(Path(file_path).resolve())
+            cached_result = self._get_cached_result(resolved_path)
+            if cached_result is not None:
+                results[file_path] = cached_result
+            else:
+                pending[file_path] = resolved_path
+        
+        if not pending:
+            return results
+        
+        # Spawned workers do not inherit this process's threads (event bus, monitors)
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_analysis_worker,
+            initargs=(self.analyzer, self.analyzer_name)
+        )
+        
+        with pool:
+            future_to_file = {
+                pool.submit(_analyze_file_in_worker, resolved_path): file_path
+                for file_path, resolved_path in pending.items()
+            }
+            
+            for future in as_completed(future_to_file):
+                file_path = future_to_file[future]
+                resolved_path = pending[file_path]
+                try:
+                    result = future.result(timeout=self.feature_extraction_timeout)
+                except Exception as e:
+                    self._report_analysis_failure(resolved_path, e)
+                    continue
+                
+                if result:
+                    self._record_analysis(resolved_path, result)
+                    results[file_path] = result
+        
+        return results
+
     def get_quick_stats(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Get quick statistics without full analysis"""
         try:
@@ -804,5 +884,25 @@ class AudioAnalysisEngine:
         return analysis_types
 
 
+# Engine used by batch_analyze process-pool workers, set up by _init_analysis_worker
+_worker_engine: Optional[AudioAnalysisEngine] = None
+
+
+def _init_analysis_worker(analyzer: Any, analyzer_name: str) -> None:
+    """Give this pool process an engine using the submitting engine's analyzer"""
+    global _worker_engine
+    _worker_engine = AudioAnalysisEngine()
+    _worker_engine.analyzer = analyzer
+    _worker_engine.analyzer_name = analyzer_name
+
+
+def _analyze_file_in_worker(file_path: str) -> Optional[AudioAnalysisResult]:
+    """Analyze a resolved file path with the worker process's engine (used by batch_analyze)
+
+    Errors propagate to the parent, which logs them and publishes the events.
+    """
+    return _worker_engine._run_analysis(file_path)
+
+
 # Global audio analysis engine instance
-audio_analysis_engine = AudioAnalysisEngine()
\ No newline at end of file
+audio_analysis_engine = AudioAnalysisEngine()
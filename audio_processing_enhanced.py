@@ -593,6 +593,7 @@ class AudioProcessingEngine:
         self.active_jobs: Dict[str, threading.Thread] = {}
         self.completed_jobs: Dict[str, Dict[str, Any]] = {}
         self.job_lock = threading.RLock()
+        self.job_finished = threading.Condition(self.job_lock)
         
         # Statistics
         self.stats = {
@@ -729,6 +730,7 @@ class AudioProcessingEngine:
                 self.completed_jobs[job.job_id] = result
                 if job.job_id in self.active_jobs:
                     del self.active_jobs[job.job_id]
+                self.job_finished.notify_all()
         
         thread = threading.Thread(target=process_wrapper, daemon=True)
         thread.start()
@@ -898,6 +900,16 @@ class AudioProcessingEngine:
             
             return None
 
+    def wait_for_job(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until a job finishes or the timeout expires, then return its status"""
+        with self.job_finished:
+            # A job that was never submitted would otherwise block for the whole timeout
+            if (job_id not in self.completed_jobs and job_id not in self.active_jobs
+                    and not any(job.job_id == job_id for job in self.processing_queue)):
+                return None
+            self.job_finished.wait_for(lambda: job_id in self.completed_jobs, timeout)
+            return self.get_job_status(job_id)
+
     def get_queue_status(self) -> Dict[str, Any]:
         """Get processing queue status"""
         with self.job_lock:
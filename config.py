@@ -6,6 +6,13 @@ from typing import Dict, Any, Optional, List, Tuple
 import hashlib
 import time
 
+# Faster JSON parsing when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class ConfigManager:
     """Unified configuration manager with progressive loading, caching, and validation"""
 
@@ -194,8 +201,16 @@ class ConfigManager:
             return {}
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config_bytes = self.config_file.read_bytes()
+            if ORJSON_AVAILABLE:
+                try:
+                    config = orjson.loads(config_bytes)
+                except orjson.JSONDecodeError:
+                    # orjson rejects NaN/Infinity and integers wider than 64 bits,
+                    # which json.dump writes; only a stdlib failure means corruption
+                    config = json.loads(config_bytes)
+            else:
+                config = json.loads(config_bytes)
 
             # Basic validation of loaded config
             if not isinstance(config, dict):
@@ -0,0 +1,43 @@
+"""
+Pytest configuration for the Pure Sound test suite
+
+Long-running tests are marked with ``@pytest.mark.slow`` and are skipped
+unless pytest is invoked with ``--run-slow``.
+
+Usage:
+    python -m pytest                # Fast tests only
+    python -m pytest --run-slow     # Include slow tests
+    python -m pytest --run-slow -m slow  # Slow tests only
+    python -m pytest -n auto --dist loadgroup  # Parallel run with pytest-xdist
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register command line options"""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked as slow"
+    )
+
+
+def pytest_configure(config):
+    """Configure pytest with custom markers"""
+    config.addinivalue_line(
+        "markers", "slow: long-running test, skipped unless --run-slow is given"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing global state in one pytest-xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow was given"""
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -20,6 +20,9 @@ import logging
 import socket
 import ipaddress
 import threading
+import atexit
+import weakref
+from collections import defaultdict, deque
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -246,6 +249,44 @@ class AuthenticationManager:
         user.last_login = time.time()
         return session_id
 
+    def authenticate_many(self, credentials: List[tuple[str, str, str]]) -> List[Optional[str]]:
+        """Authenticate a batch of (username, password, ip_address) credentials
+
+        Returns one session ID (or None on failure) per credential, in input order.
+        Each distinct username is resolved once, and all new sessions share one
+        timestamp and are registered with a single update of active_sessions.
+        """
+        now = time.time()
+        active_users: Dict[str, User] = {}
+        for username in {username for username, _, _ in credentials}:
+            user = self.users.get(username)
+            if user is not None and user.is_active:
+                active_users[username] = user
+        
+        # In a real implementation, verify password hashes here as one batch
+        
+        session_ids: List[Optional[str]] = []
+        new_sessions: Dict[str, Dict[str, Any]] = {}
+        for username, _password, ip_address in credentials:
+            user = active_users.get(username)
+            if user is None:
+                session_ids.append(None)
+                continue
+            session_id = secrets.token_urlsafe(32)
+            new_sessions[session_id] = {
+                "user_id": user.user_id,
+                "username": username,
+                "created_at": now,
+                "last_activity": now,
+                "ip_address": ip_address
+            }
+            session_ids.append(session_id)
+        
+        self.active_sessions.update(new_sessions)
+        for user in active_users.values():
+            user.last_login = now
+        return session_ids
+
     def authenticate_api_key(self, api_key: str, ip_address: str = "unknown") -> Optional[str]:
         """Authenticate using API key"""
         if api_key not in self.api_keys:
@@ -362,6 +403,8 @@ class NetworkSecurityManager:
         self.policies: Dict[str, NetworkPolicy] = {}
         self.blocked_ips: set[str] = set()
         self.rate_limits: Dict[str, Dict[str, Any]] = {}
+        # pattern -> (ip version, network address, netmask) as integers, or None if not a network
+        self._network_cache: Dict[str, Optional[tuple[int, int, int]]] = {}
 
     def add_network_policy(self, policy: NetworkPolicy) -> None:
         """Add a network security policy"""
@@ -376,15 +419,17 @@ class NetworkSecurityManager:
         if not policy.enabled:
             return True
         
+        ip_value = self._parse_ip(ip_address)
+        
         # Check blocked IPs first
         for blocked_ip in policy.blocked_ips:
-            if self._ip_matches(ip_address, blocked_ip):
+            if self._ip_matches(ip_address, blocked_ip, ip_value):
                 return False
         
         # Check allowed IPs
         if policy.allowed_ips:
             for allowed_ip in policy.allowed_ips:
-                if self._ip_matches(ip_address, allowed_ip):
+                if self._ip_matches(ip_address, allowed_ip, ip_value):
                     return True
             return False  # IP not in whitelist
         
@@ -395,14 +440,38 @@ class NetworkSecurityManager:
         
         return True  # Allow if no specific restrictions
 
-    def _ip_matches(self, ip: str, pattern: str) -> bool:
-        """Check if IP matches pattern (supports CIDR notation)"""
+    def _parse_ip(self, ip: str) -> Optional[tuple[int, int]]:
+        """Parse IP address into (version, integer value), or None if invalid"""
         try:
             ip_obj = ipaddress.ip_address(ip)
-            pattern_obj = ipaddress.ip_network(pattern, strict=False)
-            return ip_obj in pattern_obj
         except ValueError:
+            return None
+        return ip_obj.version, int(ip_obj)
+
+    def _compile_network(self, pattern: str) -> Optional[tuple[int, int, int]]:
+        """Compile IP/CIDR pattern into integer network and mask (cached)"""
+        if pattern not in self._network_cache:
+            try:
+                network = ipaddress.ip_network(pattern, strict=False)
+                self._network_cache[pattern] = (
+                    network.version, int(network.network_address), int(network.netmask)
+                )
+            except ValueError:
+                self._network_cache[pattern] = None
+        return self._network_cache[pattern]
+
+    def _ip_matches(self, ip: str, pattern: str,
+                    ip_value: Optional[tuple[int, int]] = None) -> bool:
+        """Check if IP matches pattern (supports CIDR notation)"""
+        if ip_value is None:
+            ip_value = self._parse_ip(ip)
+        network = self._compile_network(pattern)
+        if ip_value is None or network is None:
             return ip == pattern
+        
+        version, address = ip_value
+        net_version, net_address, netmask = network
+        return version == net_version and (address & netmask) == net_address
 
     def _get_vlan_info(self, ip_address: str) -> Optional[str]:
         """Get VLAN information for IP address"""
@@ -489,7 +558,11 @@ class NetworkSecurityManager:
 class AuditLogger:
     """Comprehensive audit logging system"""
 
-    def __init__(self, log_directory: str = "logs/audit"):
+    # Live loggers, flushed and closed once at interpreter exit without keeping them alive
+    _instances: "weakref.WeakSet[AuditLogger]" = weakref.WeakSet()
+
+    def __init__(self, log_directory: str = "logs/audit", synchronous: bool = False,
+                 flush_interval: float = 0.1, max_buffered_events: int = 128):
         self.log_directory = Path(log_directory)
         self.log_directory.mkdir(parents=True, exist_ok=True)
         self.event_publisher = None
@@ -498,6 +571,24 @@ class AuditLogger:
             self.event_publisher = get_service(IEventPublisher)
         except:
             pass
+        
+        # Buffered writes: entries are appended to disk by a background thread
+        # every flush_interval seconds or once max_buffered_events are pending
+        self.synchronous = synchronous
+        self.flush_interval = flush_interval
+        self.max_buffered_events = max_buffered_events
+        self._buffer: deque[tuple[Path, str]] = deque()
+        self._buffer_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._stop_flushing = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        
+        # The current day's log file stays open in append mode between flushes;
+        # _write_lock serializes disk writes so _buffer_lock is never held during I/O
+        self._write_lock = threading.Lock()
+        self._log_fd: Optional[int] = None
+        self._log_fd_path: Optional[Path] = None
+        AuditLogger._instances.add(self)
 
     def log_event(self, action: str, user_id: Optional[str], resource: str,
                  details: Dict[str, Any], ip_address: str = "unknown",
@@ -520,9 +611,7 @@ class AuditLogger:
         
         # Write to file
         log_file = self.log_directory / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
-        
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(audit_log.__dict__) + '\n')
+        self._write_entry(log_file, json.dumps(audit_log.__dict__) + '\n')
         
         # Publish event if available
         if self.event_publisher:
@@ -540,6 +629,127 @@ class AuditLogger:
         
         return log_id
 
+    def _write_entry(self, log_file: Path, line: str) -> None:
+        """Queue a log line for writing, or write it immediately in synchronous mode"""
+        with self._buffer_lock:
+            self._buffer.append((log_file, line))
+            pending = len(self._buffer)
+        
+        if self.synchronous:
+            self.flush()
+            return
+        
+        if self._flush_thread is None:
+            with self._buffer_lock:
+                if self._flush_thread is None:
+                    self._stop_flushing.clear()
+                    # The worker only holds a weak reference so an unused logger can be collected
+                    self._flush_thread = threading.Thread(
+                        target=AuditLogger._flush_loop,
+                        args=(weakref.ref(self), self._flush_requested,
+                              self._stop_flushing, self.flush_interval),
+                        daemon=True
+                    )
+                    self._flush_thread.start()
+        
+        if pending >= self.max_buffered_events:
+            self._flush_requested.set()
+
+    @staticmethod
+    def _flush_loop(logger_ref: "weakref.ReferenceType[AuditLogger]",
+                    flush_requested: threading.Event, stop: threading.Event,
+                    flush_interval: float) -> None:
+        """Background worker that periodically writes buffered log entries until stopped"""
+        while not stop.is_set():
+            flush_requested.wait(flush_interval)
+            flush_requested.clear()
+            logger = logger_ref()
+            if logger is None:
+                return
+            logger.flush()
+            del logger
+
+    def flush(self) -> None:
+        """Write all buffered log entries to disk"""
+        # Taking the write lock first keeps concurrent flushes writing batches in order
+        with self._write_lock:
+            # Swap the buffer out so log_event callers never wait on disk I/O
+            with self._buffer_lock:
+                if not self._buffer:
+                    return
+                pending, self._buffer = self._buffer, deque()
+            
+            lines_by_file: Dict[Path, List[str]] = defaultdict(list)
+            for log_file, line in pending:
+                lines_by_file[log_file].append(line)
+            
+            for log_file, lines in lines_by_file.items():
+                try:
+                    self._append(log_file, ''.join(lines).encode('utf-8'))
+                except OSError as e:
+                    logging.error(f"Failed to write {len(lines)} audit log entries to {log_file}: {e}")
+
+    def _append(self, log_file: Path, data: bytes) -> None:
+        """Append data to a log file, reusing the open descriptor for the current file"""
+        if self._log_fd_path != log_file or not self._log_fd_is_current(log_file):
+            self._close_log_fd()
+            self._log_fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._log_fd_path = log_file
+        
+        view = memoryview(data)
+        while view:
+            written = os.write(self._log_fd, view)
+            view = view[written:]
+
+    def _log_fd_is_current(self, log_file: Path) -> bool:
+        """Check the open descriptor still refers to the file at log_file (not rotated or removed)"""
+        try:
+            path_stat = os.stat(log_file)
+        except OSError:
+            return False
+        fd_stat = os.fstat(self._log_fd)
+        return (fd_stat.st_ino, fd_stat.st_dev) == (path_stat.st_ino, path_stat.st_dev)
+
+    def _close_log_fd(self) -> None:
+        """Close the open log file descriptor, if any"""
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+            self._log_fd_path = None
+
+    def close(self) -> None:
+        """Stop the flush thread, flush buffered entries and close the open log file"""
+        flush_thread = self._flush_thread
+        if flush_thread is not None:
+            self._stop_flushing.set()
+            self._flush_requested.set()
+            if flush_thread is not threading.current_thread():
+                flush_thread.join()
+            self._flush_thread = None
+        
+        self.flush()
+        with self._write_lock:
+            self._close_log_fd()
+
+    def __del__(self):
+        """Flush pending entries when an unclosed logger is garbage-collected"""
+        try:
+            # Only signal the flush thread; joining it here could block on a thread
+            # that is itself running this finalizer
+            self._stop_flushing.set()
+            self._flush_requested.set()
+            self.flush()
+            with self._write_lock:
+                self._close_log_fd()
+        except Exception:
+            pass
+
+    @classmethod
+    def _close_all(cls) -> None:
+        """Close every live logger; registered once to run at interpreter exit"""
+        for logger in list(cls._instances):
+            logger.close()
+
     def log_authentication_attempt(self, username: str, success: bool,
                                   ip_address: str = "unknown", 
                                   method: str = "password") -> str:
@@ -595,6 +805,7 @@ class AuditLogger:
                       user_id: Optional[str] = None,
                       action_pattern: Optional[str] = None) -> List[AuditLog]:
         """Retrieve audit logs with filters"""
+        self.flush()
         logs: List[AuditLog] = []
         
         for log_file in self.log_directory.glob("audit_*.log"):
@@ -621,6 +832,9 @@ class AuditLogger:
         return sorted(logs, key=lambda x: x.timestamp, reverse=True)
 
 
+atexit.register(AuditLogger._close_all)
+
+
 class SecurityManager:
     """Main security manager coordinating all security components"""
 
@@ -14,25 +14,80 @@ import unittest
 import pytest
 import tempfile
 import os
+import sys
 import json
 import time
 import threading
 import shutil
 import subprocess
+import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, List, Any, Optional
 import asyncio
 
-# Test configuration
-TEST_AUDIO_DIR = Path("tests/audio_samples")
-TEST_OUTPUT_DIR = Path("tests/output")
-TEST_CONFIG_DIR = Path("tests/config")
+# Test configuration (directories are created per test process in setUpModule)
+TEST_ROOT_DIR: Optional[Path] = None
+TEST_AUDIO_DIR: Optional[Path] = None
+TEST_OUTPUT_DIR: Optional[Path] = None
+TEST_CONFIG_DIR: Optional[Path] = None
+
+# Valid config with all required sections, serialized once at import
+_INITIAL_CONFIG_JSON: str = json.dumps({
+    "model_paths": {
+        "arnndn_model": "/usr/local/share/ffmpeg/arnndn-models/bd.cnr.mdl",
+        "custom_models_dir": "./models"
+    },
+    "presets": {
+        "speech": {
+            "compressor": {
+                "threshold": -20,
+                "ratio": 3,
+                "attack": 0.01,
+                "release": 0.1,
+                "makeup": 6
+            }
+        },
+        "music": {
+            "compressor": {
+                "threshold": -18,
+                "ratio": 4,
+                "attack": 0.005,
+                "release": 0.05,
+                "makeup": 4
+            }
+        }
+    },
+    "output_formats": {
+        "mp3": {"codec": "libmp3lame", "ext": ".mp3", "speech": [64, 96, 128], "music": [128, 192, 256]},
+        "opus": {"codec": "libopus", "ext": ".opus", "speech": [24, 32, 48], "music": [64, 96, 128]}
+    },
+    "default_settings": {
+        "format": "mp3",
+        "content_type": "speech",
+        "channels": 1
+    }
+})
+
+
+def setUpModule():
+    """Create isolated test directories for this test process"""
+    global TEST_ROOT_DIR, TEST_AUDIO_DIR, TEST_OUTPUT_DIR, TEST_CONFIG_DIR
+    
+    TEST_ROOT_DIR = Path(tempfile.mkdtemp(prefix="pure_sound_tests_"))
+    TEST_AUDIO_DIR = TEST_ROOT_DIR / "audio_samples"
+    TEST_OUTPUT_DIR = TEST_ROOT_DIR / "output"
+    TEST_CONFIG_DIR = TEST_ROOT_DIR / "config"
+    
+    for directory in (TEST_AUDIO_DIR, TEST_OUTPUT_DIR, TEST_CONFIG_DIR):
+        directory.mkdir()
+
 
-# Ensure test directories exist
-TEST_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-TEST_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-TEST_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+def tearDownModule():
+    """Remove the test directories created for this test process"""
+    if TEST_ROOT_DIR is not None:
+        shutil.rmtree(TEST_ROOT_DIR, ignore_errors=True)
 
 
 class TestCoreFunctionality(unittest.TestCase):
@@ -51,20 +106,9 @@ class TestCoreFunctionality(unittest.TestCase):
         """Clean up test environment"""
         # Remove temporary files
         for temp_file in self.temp_files:
-            try:
-                if temp_file.exists():
-                    temp_file.unlink()
-            except:
-                pass
-        
-        # Clean up test output directory
-        try:
-            if TEST_OUTPUT_DIR.exists():
-                shutil.rmtree(TEST_OUTPUT_DIR)
-                TEST_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        except:
-            pass
+            temp_file.unlink(missing_ok=True)
 
+    @pytest.mark.xdist_group(name="singletons")
     def test_configuration_management(self):
         """Test configuration management system"""
         # Import configuration management
@@ -87,24 +131,30 @@ class TestCoreFunctionality(unittest.TestCase):
         """Test dependency injection container"""
         from di_container import di_container, register_singleton, get_service
         
+        class StubService:
+            pass
+        
         # Test service registration
-        test_service = Mock()
-        di_container.register_instance(Mock, test_service)
+        test_service = StubService()
+        di_container.register_instance(StubService, test_service)
         
         # Test service resolution
-        resolved_service = di_container.get_service(Mock)
+        resolved_service = di_container.get_service(StubService)
         self.assertIsNotNone(resolved_service)
-        self.assertEqual(resolved_service, test_service)
+        self.assertIs(resolved_service, test_service)
 
+    @pytest.mark.xdist_group(name="singletons")
     def test_event_system(self):
         """Test event-driven communication system"""
         from events import event_bus, publish_event
         
         # Test event publishing
         events_received = []
+        delivered = threading.Event()
         
         def event_handler(event):
             events_received.append(event)
+            delivered.set()
         
         # Subscribe to test event
         subscription_id = event_bus.subscribe("test.event", event_handler)
@@ -114,7 +164,7 @@ class TestCoreFunctionality(unittest.TestCase):
         publish_event("test.event", test_data, "test_source")
         
         # Wait for event processing
-        time.sleep(0.1)
+        self.assertTrue(delivered.wait(timeout=1.0), "Event was not delivered")
         
         # Verify event was received
         self.assertEqual(len(events_received), 1)
@@ -124,6 +174,7 @@ class TestCoreFunctionality(unittest.TestCase):
         # Clean up
         event_bus.unsubscribe(subscription_id)
 
+    @pytest.mark.xdist_group(name="singletons")
     def test_preset_management(self):
         """Test preset management system"""
         from presets import preset_manager
@@ -144,6 +195,7 @@ class TestCoreFunctionality(unittest.TestCase):
             self.assertIn("format_var", gui_config)
             self.assertIn("bitrates", gui_config)
 
+    @pytest.mark.xdist_group(name="singletons")
     def test_job_queue_operations(self):
         """Test job queue management"""
         from job_queue import JobQueue, JobPriority, JobStatus, CompressionJob
@@ -174,14 +226,30 @@ class TestCoreFunctionality(unittest.TestCase):
 class TestSecurityFramework(unittest.TestCase):
     """Test security and authentication framework"""
 
-    def setUp(self):
-        """Set up security test environment"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up security components and a shared pool of test users"""
         # Import security components
         from security import security_manager, EncryptionManager, AuthenticationManager
         
-        self.security_manager = security_manager
-        self.encryption_manager = EncryptionManager()
-        self.auth_manager = AuthenticationManager()
+        cls.security_manager = security_manager
+        cls.encryption_manager = EncryptionManager()
+        cls.auth_manager = AuthenticationManager()
+        
+        cls.test_user_id = cls.auth_manager.create_user(
+            username="test_user",
+            email="test@example.com",
+            password="test_password_123"
+        )
+        cls.api_user_id = cls.auth_manager.create_user(
+            username="api_user",
+            email="api@example.com",
+            password="api_password_123"
+        )
+
+    def setUp(self):
+        """Reset per-test authentication state"""
+        self.auth_manager.active_sessions.clear()
 
     def test_encryption_functionality(self):
         """Test AES-256 encryption and decryption"""
@@ -206,30 +274,28 @@ class TestSecurityFramework(unittest.TestCase):
     def test_cryptographic_hashing(self):
         """Test cryptographic hashing for integrity verification"""
         # Test SHA-256 hashing
-        test_data = "Test data for hashing"
+        test_data = b"Test data for hashing"
         hash1 = self.encryption_manager.hash_data(test_data, "sha256")
         hash2 = self.encryption_manager.hash_data(test_data, "sha256")
         
         self.assertEqual(hash1, hash2)
         self.assertEqual(len(hash1), 64)  # SHA-256 hex length
         
+        # Text input is hashed as its UTF-8 encoding
+        self.assertEqual(self.encryption_manager.hash_data(test_data.decode(), "sha256"), hash1)
+        
         # Test integrity verification
         self.assertTrue(self.encryption_manager.verify_integrity(test_data, hash1, "sha256"))
         
         # Test with modified data
-        modified_data = "Test data for hashing (modified)"
+        modified_data = b"Test data for hashing (modified)"
         self.assertFalse(self.encryption_manager.verify_integrity(modified_data, hash1, "sha256"))
 
     def test_user_authentication(self):
         """Test user authentication and session management"""
         # Test user creation
-        user_id = self.auth_manager.create_user(
-            username="test_user",
-            email="test@example.com",
-            password="test_password_123"
-        )
-        
-        self.assertIsNotNone(user_id)
+        self.assertIsNotNone(self.test_user_id)
+        self.assertEqual(self.auth_manager.users["test_user"].user_id, self.test_user_id)
         
         # Test authentication
         session_id = self.auth_manager.authenticate_user(
@@ -250,15 +316,8 @@ class TestSecurityFramework(unittest.TestCase):
 
     def test_api_key_authentication(self):
         """Test API key authentication"""
-        # Create test user
-        user_id = self.auth_manager.create_user(
-            username="api_user",
-            email="api@example.com",
-            password="api_password_123"
-        )
-        
         # Create API key
-        api_key = self.auth_manager.create_api_key(user_id, "test_api_key")
+        api_key = self.auth_manager.create_api_key(self.api_user_id, "test_api_key")
         self.assertTrue(api_key.startswith("ps_"))
         
         # Test API key authentication
@@ -316,6 +375,9 @@ class TestSecurityFramework(unittest.TestCase):
         )
         
         self.assertIsNotNone(auth_log_id)
+        
+        # Write buffered entries before the test directory is removed
+        audit_logger.flush()
 
 
 class TestAudioProcessing(unittest.TestCase):
@@ -331,11 +393,7 @@ class TestAudioProcessing(unittest.TestCase):
     def tearDown(self):
         """Clean up audio test files"""
         for audio_file in self.test_audio_files:
-            try:
-                if audio_file.exists():
-                    audio_file.unlink()
-            except:
-                pass
+            audio_file.unlink(missing_ok=True)
 
     def _create_test_audio_files(self):
         """Create synthetic test audio files using FFmpeg"""
@@ -355,13 +413,7 @@ class TestAudioProcessing(unittest.TestCase):
                 self.test_audio_files.append(speech_file)
                 
                 # Create music-like audio (multiple frequencies)
-                subprocess.run([
-                    "ffmpeg", "-y", "-f", "lavfi",
-                    "-i", "sine=frequency=440:duration=5",
-                    "-f", "lavfi", "-i", "sine=frequency=880:duration=5",
-                    "-filter_complex", "[0:a][1:a]amix=inputs=2:duration=first",
-                    str(music_file)
-                ], check=True, capture_output=True)
+                self._write_tone_wav(music_file, [440, 880], duration=5)
                 self.test_audio_files.append(music_file)
             
         except (subprocess.CalledProcessError, FileNotFoundError):
@@ -371,6 +423,21 @@ class TestAudioProcessing(unittest.TestCase):
                 file_path.touch()
                 self.test_audio_files.append(file_path)
 
+    def _write_tone_wav(self, file_path: Path, frequencies: List[float],
+                        duration: float, sample_rate: int = 44100):
+        """Write an equal mix of sine tones as a mono 16-bit WAV file"""
+        import numpy as np
+        
+        t = np.arange(int(sample_rate * duration), dtype=np.float32) / sample_rate
+        signal = sum(np.sin(2 * np.pi * freq * t) for freq in frequencies) / len(frequencies)
+        pcm = (signal * 32767).astype(np.int16)
+        
+        with wave.open(str(file_path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm.tobytes())
+
     def test_audio_analysis_engine(self):
         """Test audio analysis and content detection"""
         # Skip if no audio files available
@@ -402,6 +469,7 @@ class TestAudioProcessing(unittest.TestCase):
             # Analysis may fail for synthetic files, which is acceptable
             self.assertIsInstance(e, (FileNotFoundError, subprocess.CalledProcessError, RuntimeError))
 
+    @pytest.mark.slow
     def test_audio_processing_engine(self):
         """Test audio processing and compression"""
         # Skip if no audio files available
@@ -429,23 +497,25 @@ class TestAudioProcessing(unittest.TestCase):
             self.assertIsNotNone(job_id)
             
             # Wait for processing to complete
-            max_wait = 30  # seconds
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait:
-                status = audio_processing_engine.get_job_status(job_id)
-                if status and status.get("status") in ["completed", "failed"]:
-                    break
-                time.sleep(1)
+            final_status = audio_processing_engine.wait_for_job(job_id, timeout=30)
             
             # Check final status
-            final_status = audio_processing_engine.get_job_status(job_id)
             self.assertIsNotNone(final_status)
             
         except Exception as e:
             # Processing may fail for synthetic files, which is acceptable
             self.assertIsInstance(e, (FileNotFoundError, subprocess.CalledProcessError, RuntimeError))
 
+    def test_wait_for_unknown_job(self):
+        """Test waiting on a job id that was never submitted returns immediately"""
+        from audio_processing_enhanced import audio_processing_engine
+        
+        start = time.perf_counter()
+        status = audio_processing_engine.wait_for_job("never_submitted_job", timeout=5)
+        
+        self.assertIsNone(status)
+        self.assertLess(time.perf_counter() - start, 1.0, "Unknown job should not wait for the timeout")
+
     def test_filter_presets(self):
         """Test audio filter presets"""
         from audio_processing_enhanced import audio_processing_engine
@@ -467,27 +537,49 @@ class TestAudioProcessing(unittest.TestCase):
                 ffmpeg_filter = filter_obj.to_ffmpeg_filter()
                 self.assertIsInstance(ffmpeg_filter, str)
 
+    @pytest.mark.slow
     def test_batch_processing(self):
-        """Test batch processing capabilities"""
-        # Skip if no audio files available
-        if len(self.test_audio_files) < 2:
-            self.skipTest("Need at least 2 test audio files for batch processing")
+        """Test thread and process batch analysis give the same results, events and caching"""
+        from audio_analysis_enhanced import AudioAnalysisEngine
+        
+        file_paths = []
+        for filename, frequencies in (("batch_speech.wav", [440]), ("batch_music.wav", [440, 880])):
+            file_path = TEST_AUDIO_DIR / filename
+            self._write_tone_wav(file_path, frequencies, duration=1)
+            self.test_audio_files.append(file_path)
+            file_paths.append(str(file_path))
+        
+        outcomes = {}
+        for executor in ("thread", "process"):
+            engine = AudioAnalysisEngine()
+            engine.event_publisher = Mock()
+            
+            results = engine.batch_analyze(file_paths, max_workers=2, executor=executor)
+            events = sorted(
+                (call.args[0], call.args[1]["file_path"])
+                for call in engine.event_publisher.publish_event.call_args_list
+            )
+            
+            # A repeated batch is served from the cache: same results, no new events
+            engine.event_publisher.reset_mock()
+            repeated = engine.batch_analyze(file_paths, max_workers=2, executor=executor)
+            engine.event_publisher.publish_event.assert_not_called()
+            self.assertEqual({path: result.analysis_time for path, result in repeated.items()},
+                             {path: result.analysis_time for path, result in results.items()})
+            
+            outcomes[executor] = (results, events, set(engine._analysis_cache))
         
-        from audio_analysis_enhanced import audio_analysis_engine
+        thread_results, thread_events, thread_cache = outcomes["thread"]
+        process_results, process_events, process_cache = outcomes["process"]
         
-        # Test batch analysis
-        file_paths = [str(f) for f in self.test_audio_files[:2]]
+        self.assertEqual(set(thread_results), set(file_paths))
+        self.assertEqual(set(process_results), set(thread_results))
+        for file_path, result in thread_results.items():
+            self.assertEqual(process_results[file_path].content_type, result.content_type)
         
-        try:
-            results = audio_analysis_engine.batch_analyze(file_paths, max_workers=2)
-            self.assertIsInstance(results, dict)
-            
-            # Results may be empty if analysis fails for synthetic files
-            self.assertIsInstance(results, dict)
-            
-        except Exception as e:
-            # Batch processing may fail for synthetic files
-            self.assertIsInstance(e, (FileNotFoundError, subprocess.CalledProcessError, RuntimeError))
+        self.assertEqual(len(thread_events), len(file_paths))
+        self.assertEqual(process_events, thread_events)
+        self.assertEqual(process_cache, thread_cache)
 
 
 class TestGUIFramework(unittest.TestCase):
@@ -564,18 +656,33 @@ class TestGUIFramework(unittest.TestCase):
 class TestAPIBackend(unittest.TestCase):
     """Test API backend functionality"""
 
+    SHARED_NODE_COUNT = 3
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one processing manager with registered nodes for the class"""
+        from api_backend import DistributedProcessingManager
+        
+        cls.processing_manager = DistributedProcessingManager()
+        for i in range(cls.SHARED_NODE_COUNT):
+            cls.processing_manager.register_node(f"test_node_{i}", {
+                "capabilities": {"cpu_cores": 4, "memory_gb": 8},
+                "status": "active"
+            })
+
     def setUp(self):
         """Set up API test environment"""
         self.test_files = []
         
+        # Reset shared node load between tests
+        self.processing_manager.active_jobs.clear()
+        for node_info in self.processing_manager.nodes.values():
+            node_info["active_jobs"] = 0
+        
     def tearDown(self):
         """Clean up API test files"""
         for test_file in self.test_files:
-            try:
-                if test_file.exists():
-                    test_file.unlink()
-            except:
-                pass
+            test_file.unlink(missing_ok=True)
 
     def test_cloud_storage_manager(self):
         """Test cloud storage functionality"""
@@ -598,46 +705,37 @@ class TestAPIBackend(unittest.TestCase):
 
     def test_distributed_processing_manager(self):
         """Test distributed processing management"""
-        from api_backend import DistributedProcessingManager
-        
-        # Create processing manager
-        manager = DistributedProcessingManager()
+        manager = self.processing_manager
         
         # Test node registration
-        node_id = "test_node_1"
+        node_id = "test_node_registered"
         node_info = {
             "capabilities": {"cpu_cores": 4, "memory_gb": 8},
             "status": "active"
         }
         
         result = manager.register_node(node_id, node_info)
+        self.addCleanup(manager.unregister_node, node_id)
         self.assertTrue(result)
         
         # Test node health
         healthy_nodes = manager.get_healthy_nodes()
         self.assertIn(node_id, healthy_nodes)
         
+        # Load the shared nodes so the new node is the least loaded
+        for i in range(self.SHARED_NODE_COUNT):
+            manager.assign_job(f"shared_job_{i}", f"test_node_{i}")
+        
         # Test least loaded node selection
         least_loaded = manager.get_least_loaded_node()
         self.assertEqual(least_loaded, node_id)
 
     def test_load_balancer(self):
         """Test intelligent load balancer"""
-        from api_backend import DistributedProcessingManager, LoadBalancer
+        from api_backend import LoadBalancer
         
-        # Create processing manager and load balancer
-        processing_manager = DistributedProcessingManager()
-        load_balancer = LoadBalancer(processing_manager)
-        
-        # Register test nodes
-        for i in range(3):
-            node_id = f"test_node_{i}"
-            node_info = {
-                "capabilities": {"cpu_cores": 4, "memory_gb": 8},
-                "status": "active",
-                "active_jobs": i  # Different loads
-            }
-            processing_manager.register_node(node_id, node_info)
+        # Create load balancer over the shared processing manager
+        load_balancer = LoadBalancer(self.processing_manager)
         
         # Test node selection with different requirements
         job_requirements = {"gpu_required": False}
@@ -684,13 +782,34 @@ class TestAPIBackend(unittest.TestCase):
         self.assertEqual(response_model.status, response_data["status"])
 
 
+def _submit_job(job_queues, job_id):
+    """Simulate a job submission onto the shard for job_id"""
+    try:
+        job_queues[job_id % len(job_queues)].append(job_id)
+        return ("success", job_id)
+    except Exception as e:
+        return ("error", job_id, str(e))
+
+
+@pytest.mark.xdist_group(name="performance")
 class TestPerformanceAndScalability(unittest.TestCase):
     """Test performance and scalability features"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create a thread pool shared by the concurrency tests"""
+        cls.executor = ThreadPoolExecutor(max_workers=16)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the shared thread pool"""
+        cls.executor.shutdown(wait=True)
+
     def setUp(self):
         """Set up performance test environment"""
         self.performance_data = []
 
+    @pytest.mark.slow
     def test_concurrent_processing(self):
         """Test concurrent job processing"""
         from api_backend import DistributedProcessingManager
@@ -732,36 +851,37 @@ class TestPerformanceAndScalability(unittest.TestCase):
         
         print(f"Distributed jobs across {len(manager.nodes)} nodes in {processing_time:.3f}s")
 
+    @pytest.mark.slow
     def test_memory_usage_tracking(self):
         """Test memory usage tracking and optimization"""
-        import psutil
-        import gc
+        import tracemalloc
         
-        # Get baseline memory usage
-        process = psutil.Process()
-        baseline_memory = process.memory_info().rss
-        
-        # Test memory usage with multiple operations
         from audio_analysis_enhanced import audio_analysis_engine
         
-        # Perform multiple analysis operations
-        for i in range(10):
-            # Simulate analysis (may fail for non-existent files)
-            try:
-                # This would normally analyze a file
-                # For testing, we'll just trigger garbage collection
-                gc.collect()
-            except:
-                pass
-        
-        # Check memory growth
-        current_memory = process.memory_info().rss
+        # Trace Python allocations made by the operations under test
+        tracemalloc.start()
+        try:
+            baseline_memory, _ = tracemalloc.get_traced_memory()
+            
+            # Perform multiple analysis operations (files don't exist, so
+            # this exercises the failure path without FFmpeg)
+            for i in range(10):
+                audio_analysis_engine.analyze_file(
+                    str(TEST_AUDIO_DIR / f"memory_test_{i}.wav"), use_cache=False
+                )
+            
+            # Check memory growth
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
         memory_growth = current_memory - baseline_memory
         
         # Allow some memory growth but not excessive
         self.assertLess(memory_growth, 100 * 1024 * 1024)  # Less than 100MB growth
         
-        print(f"Memory growth after 10 operations: {memory_growth / 1024 / 1024:.2f}MB")
+        print(f"Memory growth after 10 operations: {memory_growth / 1024 / 1024:.2f}MB "
+              f"(peak {peak_memory / 1024 / 1024:.2f}MB)")
 
     def test_response_time_benchmarks(self):
         """Test API response time benchmarks"""
@@ -794,77 +914,72 @@ class TestPerformanceAndScalability(unittest.TestCase):
                 # Some operations may fail without proper setup
                 print(f"{operation_name}: Failed - {e}")
 
+    @pytest.mark.slow
     def test_throughput_testing(self):
         """Test system throughput under load"""
-        import threading
-        import queue
+        from collections import deque
         
-        # Test job submission throughput
-        job_queue = queue.Queue()
-        results = []
-        
-        def submit_job(job_id):
-            try:
-                # Simulate job submission
-                job_queue.put(job_id)
-                results.append(("success", job_id))
-            except Exception as e:
-                results.append(("error", job_id, str(e)))
+        # Test job submission throughput (queue sharded by job ID)
+        job_queues = [deque() for _ in range(16)]
         
         # Submit multiple jobs concurrently
-        start_time = time.time()
-        threads = []
-        
-        for i in range(50):
-            thread = threading.Thread(target=submit_job, args=(i,))
-            threads.append(thread)
-            thread.start()
+        num_jobs = 50
+        max_errors = num_jobs // 10
+        start_ns = time.perf_counter_ns()
+        futures = [self.executor.submit(_submit_job, job_queues, i) for i in range(num_jobs)]
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        throughput_time = time.time() - start_time
+        # Consume results as they complete, stopping once the success rate is unreachable
+        results = []
+        error_count = 0
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result[0] != "success":
+                error_count += 1
+                if error_count > max_errors:
+                    for pending in futures:
+                        pending.cancel()
+                    self.fail(f"More than {max_errors} of {num_jobs} job submissions failed: {result}")
+        
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         # Analyze results
         success_count = sum(1 for result in results if result[0] == "success")
-        throughput = len(results) / throughput_time
+        throughput = len(results) * 1_000_000_000 / elapsed_ns
         
-        print(f"Submitted {len(results)} jobs in {throughput_time:.3f}s")
+        print(f"Submitted {len(results)} jobs in {elapsed_ns / 1_000_000:.3f}ms")
         print(f"Throughput: {throughput:.2f} jobs/second")
         print(f"Success rate: {success_count / len(results) * 100:.1f}%")
         
+        # Free-threaded builds (PEP 703) are held to a higher throughput floor
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        if gil_enabled:
+            print("GIL enabled: throughput does not reflect free-threaded scaling")
+        min_throughput = 10 if gil_enabled else 1000
+        
         # Basic assertions
-        self.assertGreater(throughput, 10)  # At least 10 jobs/second
+        self.assertEqual(sum(len(shard) for shard in job_queues), len(results))
+        self.assertGreater(throughput, min_throughput)
         self.assertGreater(success_count, len(results) * 0.9)  # 90% success rate
 
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for end-to-end functionality"""
 
-    def setUp(self):
-        """Set up integration test environment"""
-        self.integration_test_files = []
+    @classmethod
+    def setUpClass(cls):
+        """Import the pipeline components once for the class"""
+        # Random bytes for test keys, drawn with a single getrandom() call
+        cls._entropy = memoryview(os.urandom(4096))
+        cls._entropy_offset = 0
         
-    def tearDown(self):
-        """Clean up integration test files"""
-        for test_file in self.integration_test_files:
-            try:
-                if test_file.exists():
-                    test_file.unlink()
-            except:
-                pass
-
-    def test_full_pipeline_integration(self):
-        """Test complete audio processing pipeline"""
-        # This would test the full pipeline:
-        # 1. Audio analysis
-        # 2. Content detection
-        # 3. Preset selection
-        # 4. Processing
-        # 5. Result verification
+        # Shared read-only input file for workflow tests
+        cls.shared_input_file = TEST_AUDIO_DIR / "integration_test.wav"
+        cls.shared_input_file.touch()
+        
+        cls.pipeline_components = {}
+        cls.component_import_error = None
         
-        # For now, test that all components can be imported and initialized
         try:
             # Core components
             from config import config_manager
@@ -882,93 +997,99 @@ class TestIntegration(unittest.TestCase):
             # API
             from api_backend import PureSoundAPI
             
-            # All imports successful
-            self.assertTrue(True, "All core components imported successfully")
-            
+            cls.pipeline_components = {
+                "config_manager": config_manager,
+                "di_container": di_container,
+                "event_bus": event_bus,
+                "security_manager": security_manager,
+                "audio_analysis_engine": audio_analysis_engine,
+                "audio_processing_engine": audio_processing_engine,
+                "PureSoundGUI": PureSoundGUI,
+                "PureSoundAPI": PureSoundAPI,
+            }
         except ImportError as e:
-            self.fail(f"Integration test failed due to import error: {e}")
+            cls.component_import_error = e
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared input file"""
+        cls.shared_input_file.unlink(missing_ok=True)
+
+    @classmethod
+    def _next_key(cls, size: int = 32) -> bytes:
+        """Take the next random key from the class entropy pool"""
+        if cls._entropy_offset + size > len(cls._entropy):
+            cls._entropy = memoryview(os.urandom(4096))
+            cls._entropy_offset = 0
+        
+        key = bytes(cls._entropy[cls._entropy_offset:cls._entropy_offset + size])
+        cls._entropy_offset += size
+        return key
+
+    def setUp(self):
+        """Set up integration test environment"""
+        self.integration_test_files = []
+        
+    def tearDown(self):
+        """Clean up integration test files"""
+        for test_file in self.integration_test_files:
+            test_file.unlink(missing_ok=True)
+
+    def test_full_pipeline_integration(self):
+        """Test complete audio processing pipeline"""
+        # This would test the full pipeline:
+        # 1. Audio analysis
+        # 2. Content detection
+        # 3. Preset selection
+        # 4. Processing
+        # 5. Result verification
+        
+        # For now, test that all components can be imported and initialized
+        if self.component_import_error is not None:
+            self.fail(f"Integration test failed due to import error: {self.component_import_error}")
+        
+        # All imports successful
+        for name, component in self.pipeline_components.items():
+            self.assertIsNotNone(component, f"{name} should be available")
 
     def test_end_to_end_workflow(self):
         """Test complete workflow from file input to processed output"""
-        # Create test input file
-        input_file = TEST_AUDIO_DIR / "integration_test.wav"
-        input_file.touch()
-        self.integration_test_files.append(input_file)
-        
+        input_file = self.shared_input_file
         expected_output = TEST_OUTPUT_DIR / "integration_test_processed.mp3"
         
-        try:
-            # This would be a full integration test:
-            # 1. Analyze audio
-            # 2. Apply appropriate processing
-            # 3. Generate output
-            # 4. Verify results
-            
-            # For now, just verify the workflow components exist
-            from audio_processing_enhanced import audio_processing_engine
-            
-            # Create processing job
-            job = audio_processing_engine.create_processing_job(
-                input_file=str(input_file),
-                output_files=[str(expected_output)],
-                preset_name="speech_clean"
-            )
-            
-            self.assertIsNotNone(job)
-            self.assertEqual(len(job.output_files), 1)
-            
-        except Exception as e:
-            # Expected to fail without proper audio files
-            self.assertIsInstance(e, (FileNotFoundError, subprocess.CalledProcessError))
+        # This would be a full integration test:
+        # 1. Analyze audio
+        # 2. Apply appropriate processing
+        # 3. Generate output
+        # 4. Verify results
+        
+        # For now, just verify the workflow components exist
+        from audio_processing_enhanced import audio_processing_engine
+        
+        # Creating a job only builds its description (no ffmpeg or file access),
+        # so any exception here is a real regression
+        job = audio_processing_engine.create_processing_job(
+            input_file=str(input_file),
+            output_files=[str(expected_output)],
+            preset_name="speech_clean"
+        )
+        
+        self.assertIsNotNone(job)
+        self.assertEqual(job.input_file, str(input_file))
+        self.assertEqual(job.output_files, [str(expected_output)])
+        self.assertTrue(job.filters)
 
     def test_configuration_persistence(self):
         """Test configuration persistence across restarts"""
         from config import ConfigManager
         
-        # Use a temporary config file for testing
-        import tempfile
-        import json
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_config_file = f.name
-            # Write initial valid config with all required sections
-            initial_config = {
-                "model_paths": {
-                    "arnndn_model": "/usr/local/share/ffmpeg/arnndn-models/bd.cnr.mdl",
-                    "custom_models_dir": "./models"
-                },
-                "presets": {
-                    "speech": {
-                        "compressor": {
-                            "threshold": -20,
-                            "ratio": 3,
-                            "attack": 0.01,
-                            "release": 0.1,
-                            "makeup": 6
-                        }
-                    },
-                    "music": {
-                        "compressor": {
-                            "threshold": -18,
-                            "ratio": 4,
-                            "attack": 0.005,
-                            "release": 0.05,
-                            "makeup": 4
-                        }
-                    }
-                },
-                "output_formats": {
-                    "mp3": {"codec": "libmp3lame", "ext": ".mp3", "speech": [64, 96, 128], "music": [128, 192, 256]},
-                    "opus": {"codec": "libopus", "ext": ".opus", "speech": [24, 32, 48], "music": [64, 96, 128]}
-                },
-                "default_settings": {
-                    "format": "mp3",
-                    "content_type": "speech",
-                    "channels": 1
-                }
-            }
-            json.dump(initial_config, f)
-        
-        try:
+        # Use a temporary config directory, in memory-backed /dev/shm where available
+        shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        with tempfile.TemporaryDirectory(dir=shm_dir) as temp_dir:
+            temp_config_file = os.path.join(temp_dir, "config.json")
+            with open(temp_config_file, 'w') as f:
+                f.write(_INITIAL_CONFIG_JSON)
+            
             # Create first config manager
             config_manager1 = ConfigManager(config_file=temp_config_file)
             
@@ -987,12 +1108,24 @@ class TestIntegration(unittest.TestCase):
             
             # Restore original
             config_manager2.set_default_setting("format", original_value)
+
+    def test_configuration_non_strict_json_values(self):
+        """Test config files with NaN or big integers written by json.dump still load"""
+        from config import ConfigManager
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_config_file = Path(temp_dir) / "config.json"
+            config = json.loads(_INITIAL_CONFIG_JSON)
+            config["custom_values"] = {"gain": float("nan"), "sample_count": 2 ** 70}
+            with open(temp_config_file, 'w') as f:
+                json.dump(config, f)
             
-        finally:
-            # Clean up temp file
-            import os
-            if os.path.exists(temp_config_file):
-                os.unlink(temp_config_file)
+            loaded = ConfigManager(config_file=str(temp_config_file))._load_from_file()
+            
+            self.assertEqual(loaded["custom_values"]["sample_count"], 2 ** 70)
+            self.assertNotEqual(loaded["custom_values"]["gain"], loaded["custom_values"]["gain"])
+            self.assertFalse(temp_config_file.with_suffix('.backup').exists(),
+                             "Valid config should not be treated as corrupt")
 
     def test_security_integration(self):
         """Test security integration across components"""
@@ -1005,7 +1138,7 @@ class TestIntegration(unittest.TestCase):
         test_data = {"sensitive": "integration_test_data"}
         
         # Encrypt data
-        key = os.urandom(32)
+        key = self._next_key()
         encrypted_data = encryption_manager.encrypt_data(json.dumps(test_data), key)
         
         # Decrypt and verify
@@ -1026,13 +1159,15 @@ class TestIntegration(unittest.TestCase):
         )
         
         self.assertIsNotNone(log_id)
+        audit_logger.flush()
+
+
+# Test method names per class, discovered once per process
+_TEST_NAMES_CACHE: Dict[type, List[str]] = {}
 
 
 def create_test_suite():
     """Create and configure the test suite"""
-    # Create test loader
-    loader = unittest.TestLoader()
-    
     # Create test suite
     suite = unittest.TestSuite()
     
@@ -1048,12 +1183,22 @@ def create_test_suite():
     ]
     
     for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+        # Suites drop their tests once run, so cache the names and build fresh instances
+        test_names = _TEST_NAMES_CACHE.get(test_class)
+        if test_names is None:
+            test_names = unittest.defaultTestLoader.getTestCaseNames(test_class)
+            _TEST_NAMES_CACHE[test_class] = test_names
+        suite.addTests(test_class(name) for name in test_names)
     
     return suite
 
 
+def _failure_message(traceback_text: str) -> str:
+    """One-line summary of a failure: the assertion message, else the traceback's last line"""
+    _, sep, tail = traceback_text.rpartition('AssertionError:')
+    return tail.strip() if sep else traceback_text.splitlines()[-1]
+
+
 def run_comprehensive_tests():
     """Run the comprehensive test suite"""
     print("=" * 80)
@@ -1075,28 +1220,36 @@ def run_comprehensive_tests():
     result = runner.run(suite)
     end_time = time.time()
     
-    # Print summary
-    print("\n" + "=" * 80)
-    print("TEST SUMMARY")
-    print("=" * 80)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
-    print(f"Total time: {end_time - start_time:.2f} seconds")
+    # Build the summary and emit it with a single write
+    lines = [
+        "",
+        "=" * 80,
+        "TEST SUMMARY",
+        "=" * 80,
+        f"Tests run: {result.testsRun}",
+        f"Failures: {len(result.failures)}",
+        f"Errors: {len(result.errors)}",
+        f"Skipped: {len(result.skipped)}",
+        f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%",
+        f"Total time: {end_time - start_time:.2f} seconds",
+    ]
     
     if result.failures:
-        print("\nFAILURES:")
-        for test, traceback in result.failures:
-            print(f"- {test}: {traceback.split('AssertionError:')[-1].strip()}")
+        lines.append("\nFAILURES:")
+        lines.extend(
+            f"- {test}: {_failure_message(traceback)}"
+            for test, traceback in result.failures
+        )
     
     if result.errors:
-        print("\nERRORS:")
-        for test, traceback in result.errors:
-            print(f"- {test}: {traceback.splitlines()[-1]}")
+        lines.append("\nERRORS:")
+        lines.extend(
+            f"- {test}: {traceback.splitlines()[-1]}"
+            for test, traceback in result.errors
+        )
     
-    print("=" * 80)
+    lines.append("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return result.wasSuccessful()
 
@@ -10,28 +10,149 @@ This module tests all database-related functionality including:
 """
 
 import unittest
+import copy
+import io
 import json
+import mmap
 import os
 import tempfile
 import shutil
+import sys
 import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from jsonschema import Draft7Validator, ValidationError
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
+from jsonschema import Draft7Validator, ValidationError, validators
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Scratch directories go on memory-backed /dev/shm where available
+_SCRATCH_ROOT: Optional[str] = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes"""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _write_json(path: Union[str, Path], obj: Any) -> None:
+    """Serialize obj to path compactly in a single write"""
+    data = _dumps(obj)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _read_json(path: Union[str, Path]) -> Any:
+    """Deserialize the JSON document at path"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _iter_json_items(path: Union[str, Path]) -> Iterator[Any]:
+    """Yield the elements of the top-level JSON array at path, streaming when ijson is available"""
+    if not IJSON_AVAILABLE:
+        yield from _read_json(path)
+        return
+    with open(path, 'rb') as f:
+        # use_float keeps numbers as float (not Decimal), matching the json fallback
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def _build_index(path: Union[str, Path],
+                 key: Callable[[Dict[str, Any]], Any]) -> Tuple[Dict[Any, Dict[str, Any]], Dict[Any, set]]:
+    """Stream the items at path once, returning an id lookup and a key -> ids index"""
+    id_to_item: Dict[Any, Dict[str, Any]] = {}
+    index: Dict[Any, set] = defaultdict(set)
+    for item in _iter_json_items(path):
+        id_to_item[item["id"]] = item
+        index[key(item)].add(item["id"])
+    return id_to_item, index
+
+
+def _atomic_write_json(path: Union[str, Path], obj: Any, tmp_suffix: str = ".tmp") -> None:
+    """Write obj to a temp file beside path, then rename it over path"""
+    temp_path = f"{os.fspath(path)}{tmp_suffix}"
+    try:
+        _write_json(temp_path, obj)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _json_deepcopy(obj: Any) -> Any:
+    """Deep-copy JSON-compatible data"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(orjson.dumps(obj))
+    return copy.deepcopy(obj)
+
+
+def _read_json_mapped(path: Union[str, Path]) -> Any:
+    """Deserialize the JSON document at path through a read-only memory map"""
+    # MAP_POPULATE prefaults the whole file since it is consumed in full
+    flags = mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, flags=flags, prot=mmap.PROT_READ) as mm:
+        if ORJSON_AVAILABLE:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(mm[:])
+
+
+# Draft 7 treats 1.0 as an "integer"; presets need real ints, so reject floats (and bools)
+_StrictIntDraft7Validator = validators.extend(
+    Draft7Validator,
+    type_checker=Draft7Validator.TYPE_CHECKER.redefine(
+        "integer", lambda checker, instance: isinstance(instance, int) and not isinstance(instance, bool)
+    ),
+)
+
+
+def _key_by(records: List[Dict[str, Any]], field: str) -> Dict[Any, Dict[str, Any]]:
+    """Map each record's unique field value to the record"""
+    return dict(zip(map(itemgetter(field), records), records))
+
+
+def _index_by(records: List[Dict[str, Any]], *fields: str) -> Dict[str, Dict[Any, List[Dict[str, Any]]]]:
+    """Group records by the value of each field in a single pass over records"""
+    indexes: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {field: defaultdict(list) for field in fields}
+    for record in records:
+        for field, index in indexes.items():
+            index[record[field]].append(record)
+    return indexes
 
 
 class TestConfigurationDatabase(unittest.TestCase):
     """Test configuration database operations"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.test_dir) / "test_config.json"
+    @classmethod
+    def setUpClass(cls):
+        """Create a shared test directory, build the configuration template and compile the schema once"""
+        cls.test_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
         
-        # Default configuration structure
-        self.default_config = {
+        # Default configuration structure, serialized once and decoded per test
+        default_config = {
             "model_paths": {
                 "arnndn_model": "/usr/local/share/ffmpeg/arnndn-models/bd.cnr.mdl",
                 "custom_models_dir": "./models"
@@ -80,7 +201,7 @@ class TestConfigurationDatabase(unittest.TestCase):
         }
         
         # Schema for validation
-        self.config_schema = {
+        cls.config_schema = {
             "type": "object",
             "required": ["model_paths", "presets", "output_formats", "default_settings"],
             "properties": {
@@ -119,49 +240,53 @@ class TestConfigurationDatabase(unittest.TestCase):
                 }
             }
         }
+        cls.default_config_bytes = _dumps(default_config)
+        cls.validator = Draft7Validator(cls.config_schema)
+    
+    def setUp(self):
+        """Set up test environment"""
+        # Tests share the class directory, so each uses its own file
+        self.config_file = Path(self.test_dir) / f"{self._testMethodName}.json"
+        self.default_config = _loads(self.default_config_bytes)
     
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def test_config_write_and_read(self):
         """Test basic configuration write and read operations"""
         # Write configuration
-        with open(self.config_file, 'w') as f:
-            json.dump(self.default_config, f, indent=2)
+        self.config_file.write_bytes(self.default_config_bytes)
         
         # Read configuration
-        with open(self.config_file, 'r') as f:
-            loaded_config = json.load(f)
+        loaded_config = _read_json(self.config_file)
         
         # Verify data integrity
+        self.assertEqual(loaded_config, self.default_config)
         self.assertEqual(loaded_config["default_settings"]["format"], "mp3")
         self.assertEqual(loaded_config["default_settings"]["channels"], 1)
         self.assertIn("mp3", loaded_config["output_formats"])
     
     def test_config_schema_validation(self):
         """Test configuration schema validation"""
-        validator = Draft7Validator(self.config_schema)
-        
         # Test valid configuration
-        errors = list(validator.iter_errors(self.default_config))
+        errors = list(self.validator.iter_errors(self.default_config))
         self.assertEqual(errors, [], "Valid configuration should have no errors")
         
         # Test invalid configuration
-        invalid_config = self.default_config.copy()
+        invalid_config = _json_deepcopy(self.default_config)
         del invalid_config["model_paths"]  # Remove required field
         
-        errors = list(validator.iter_errors(invalid_config))
+        errors = list(self.validator.iter_errors(invalid_config))
         self.assertGreater(len(errors), 0, "Invalid configuration should have errors")
     
     def test_config_query_operations(self):
         """Test configuration query operations"""
         # Write configuration
-        with open(self.config_file, 'w') as f:
-            json.dump(self.default_config, f, indent=2)
+        self.config_file.write_bytes(self.default_config_bytes)
         
-        with open(self.config_file, 'r') as f:
-            config = json.load(f)
+        config = _read_json(self.config_file)
         
         # Query: Get all output formats
         formats = list(config.get("output_formats", {}).keys())
@@ -178,36 +303,22 @@ class TestConfigurationDatabase(unittest.TestCase):
     def test_config_update_transaction(self):
         """Test configuration update with transaction-like behavior"""
         # Initial write
-        with open(self.config_file, 'w') as f:
-            json.dump(self.default_config, f, indent=2)
+        self.config_file.write_bytes(self.default_config_bytes)
+        
+        # Read current config
+        config = _read_json(self.config_file)
+        
+        # Modify
+        config["default_settings"]["format"] = "opus"
         
         # Atomic update using temp file
-        temp_file = Path(str(self.config_file) + ".tmp")
-        try:
-            # Read current config
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-            
-            # Modify
-            config["default_settings"]["format"] = "opus"
-            
-            # Write to temp file first
-            with open(temp_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            # Atomic rename
-            temp_file.replace(self.config_file)
-            
-            # Verify update
-            with open(self.config_file, 'r') as f:
-                updated_config = json.load(f)
-            
-            self.assertEqual(updated_config["default_settings"]["format"], "opus")
-            
-        finally:
-            # Cleanup temp file if it exists
-            if temp_file.exists():
-                temp_file.unlink()
+        _atomic_write_json(self.config_file, config)
+        self.assertFalse(Path(f"{self.config_file}.tmp").exists())
+        
+        # Verify update
+        updated_config = _read_json(self.config_file)
+        
+        self.assertEqual(updated_config["default_settings"]["format"], "opus")
     
     def test_config_concurrent_access(self):
         """Test configuration file concurrent access"""
@@ -217,28 +328,25 @@ class TestConfigurationDatabase(unittest.TestCase):
         lock = threading.Lock()
         
         # Initialize the config file first
-        with open(config_file, 'w') as f:
-            json.dump(self.default_config, f, indent=2)
+        config_file.write_bytes(self.default_config_bytes)
+        
+        # Plain string paths keep Path construction out of the writer loop
+        config_path = os.fspath(config_file)
         
         def writer_thread(thread_id):
+            # One temp file name per thread so concurrent writers never share it
+            tmp_suffix = f".tmp.{thread_id}"
             try:
-                for i in range(10):
-                    temp_file = Path(str(config_file) + f".tmp.{thread_id}.{i}")
+                for _ in range(10):
                     try:
-                        with open(config_file, 'r') as f:
-                            config = json.load(f)
+                        config = _read_json(config_path)
                         config["default_settings"]["channels"] = thread_id
-                        with open(temp_file, 'w') as f:
-                            json.dump(config, f, indent=2)
-                        temp_file.replace(config_file)
+                        _atomic_write_json(config_path, config, tmp_suffix)
                         with lock:
                             successful_writes[0] += 1
                     except (FileNotFoundError, PermissionError):
                         # File might be temporarily unavailable or locked
                         pass
-                    finally:
-                        if temp_file.exists():
-                            temp_file.unlink(missing_ok=True)
             except Exception as e:
                 errors.append(str(e))
         
@@ -246,8 +354,7 @@ class TestConfigurationDatabase(unittest.TestCase):
             try:
                 for _ in range(10):
                     try:
-                        with open(config_file, 'r') as f:
-                            config = json.load(f)
+                        config = _read_json_mapped(config_path)
                         # Just read, don't modify
                         _ = config.get("default_settings", {}).get("format")
                     except (FileNotFoundError, PermissionError):
@@ -271,21 +378,20 @@ class TestConfigurationDatabase(unittest.TestCase):
             t.join()
         
         # Verify the file is still readable after concurrent access
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        config = _read_json(config_file)
         self.assertIn("default_settings", config)
 
 
 class TestJobQueueDatabase(unittest.TestCase):
     """Test job queue database operations"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.queue_file = Path(self.test_dir) / "job_queue.json"
+    @classmethod
+    def setUpClass(cls):
+        """Create a test directory shared by the class and serialize the sample jobs"""
+        cls.test_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
         
-        # Sample job data
-        self.sample_jobs = [
+        # Sample job data, decoded into a fresh list per test
+        cls.sample_jobs_bytes = _dumps([
             {
                 "job_id": "job_001",
                 "input_file": "/audio/input1.wav",
@@ -319,174 +425,147 @@ class TestJobQueueDatabase(unittest.TestCase):
                 "progress": 1.0,
                 "created_at": "2025-01-01T10:10:00Z"
             }
-        ]
+        ])
     
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    def setUp(self):
+        """Set up test environment"""
+        self.queue_file = Path(self.test_dir) / f"{self._testMethodName}.json"
+        self.sample_jobs = _loads(self.sample_jobs_bytes)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def test_job_insert_and_query(self):
         """Test job insertion and query operations"""
         # Write initial jobs
-        with open(self.queue_file, 'w') as f:
-            json.dump(self.sample_jobs, f, indent=2)
+        self.queue_file.write_bytes(self.sample_jobs_bytes)
         
         # Query: Get all jobs
-        with open(self.queue_file, 'r') as f:
-            jobs = json.load(f)
+        jobs = _read_json(self.queue_file)
         
-        self.assertEqual(len(jobs), 3)
+        self.assertEqual(jobs, self.sample_jobs)
+        
+        # Build the lookup indexes once, then answer every query from them
+        jobs_by_id = _key_by(jobs, "job_id")
+        jobs_by_status = _index_by(jobs, "status")["status"]
         
         # Query: Get job by ID
-        job = next((j for j in jobs if j["job_id"] == "job_002"), None)
+        job = jobs_by_id.get("job_002")
         self.assertIsNotNone(job)
         self.assertEqual(job["status"], "running")
         
         # Query: Get jobs by status
-        pending_jobs = [j for j in jobs if j["status"] == "pending"]
+        pending_jobs = jobs_by_status["pending"]
         self.assertEqual(len(pending_jobs), 1)
         self.assertEqual(pending_jobs[0]["job_id"], "job_001")
     
     def test_job_filter_queries(self):
         """Test job filtering and complex queries"""
         # Write initial jobs
-        with open(self.queue_file, 'w') as f:
-            json.dump(self.sample_jobs, f, indent=2)
+        self.queue_file.write_bytes(self.sample_jobs_bytes)
+        
+        jobs = _read_json(self.queue_file)
         
-        with open(self.queue_file, 'r') as f:
-            jobs = json.load(f)
+        # Index every filtered field in one pass and reuse the indexes per query
+        indexes = _index_by(jobs, "format", "priority", "status")
         
         # Filter by format
-        mp3_jobs = [j for j in jobs if j["format"] == "mp3"]
+        mp3_jobs = indexes["format"]["mp3"]
         self.assertEqual(len(mp3_jobs), 2)
         
         # Filter by priority
-        high_priority_jobs = [j for j in jobs if j["priority"] == "high"]
+        high_priority_jobs = indexes["priority"]["high"]
         self.assertEqual(len(high_priority_jobs), 1)
         
         # Filter by multiple criteria
-        completed_high_priority = [j for j in jobs if j["status"] == "completed"]
+        completed_high_priority = indexes["status"]["completed"]
         self.assertEqual(len(completed_high_priority), 1)
         
-        # Sort by created_at
-        sorted_jobs = sorted(jobs, key=lambda j: j["created_at"])
-        self.assertEqual(sorted_jobs[0]["job_id"], "job_001")
-        self.assertEqual(sorted_jobs[-1]["job_id"], "job_003")
+        # Sort by created_at (in place, the loaded order is not needed again)
+        jobs.sort(key=itemgetter("created_at"))
+        self.assertEqual(jobs[0]["job_id"], "job_001")
+        self.assertEqual(jobs[-1]["job_id"], "job_003")
     
     def test_job_update_operations(self):
         """Test job update operations"""
-        # Write initial jobs
-        with open(self.queue_file, 'w') as f:
-            json.dump(self.sample_jobs, f, indent=2)
+        # Update job_001 in memory and write the queue once
+        jobs = self.sample_jobs
+        job = _key_by(jobs, "job_id")["job_001"]
+        job["status"] = "running"
+        job["progress"] = 0.25
         
-        # Update job status
-        with open(self.queue_file, 'r') as f:
-            jobs = json.load(f)
-        
-        # Find and update job_001
-        for job in jobs:
-            if job["job_id"] == "job_001":
-                job["status"] = "running"
-                job["progress"] = 0.25
-                break
-        
-        # Write back
-        with open(self.queue_file, 'w') as f:
-            json.dump(jobs, f, indent=2)
+        _write_json(self.queue_file, jobs)
         
         # Verify update
-        with open(self.queue_file, 'r') as f:
-            updated_jobs = json.load(f)
+        updated_jobs = _read_json(self.queue_file)
         
-        updated_job = next((j for j in updated_jobs if j["job_id"] == "job_001"), None)
+        updated_job = _key_by(updated_jobs, "job_id").get("job_001")
         self.assertEqual(updated_job["status"], "running")
         self.assertEqual(updated_job["progress"], 0.25)
     
     def test_job_deletion(self):
         """Test job deletion operations"""
-        # Write initial jobs
-        with open(self.queue_file, 'w') as f:
-            json.dump(self.sample_jobs, f, indent=2)
-        
-        # Delete job_002
-        with open(self.queue_file, 'r') as f:
-            jobs = json.load(f)
+        # Delete job_002 in memory and write the queue once
+        jobs = [j for j in self.sample_jobs if j["job_id"] != "job_002"]
         
-        jobs = [j for j in jobs if j["job_id"] != "job_002"]
-        
-        with open(self.queue_file, 'w') as f:
-            json.dump(jobs, f, indent=2)
+        _write_json(self.queue_file, jobs)
         
         # Verify deletion
-        with open(self.queue_file, 'r') as f:
-            remaining_jobs = json.load(f)
+        remaining_jobs = _read_json(self.queue_file)
         
         self.assertEqual(len(remaining_jobs), 2)
-        job_ids = [j["job_id"] for j in remaining_jobs]
+        job_ids = set(map(itemgetter("job_id"), remaining_jobs))
         self.assertNotIn("job_002", job_ids)
     
     def test_job_queue_transaction(self):
         """Test job queue transaction operations"""
         # Initial state
-        with open(self.queue_file, 'w') as f:
-            json.dump(self.sample_jobs, f, indent=2)
+        self.queue_file.write_bytes(self.sample_jobs_bytes)
         
         # Simulate transaction: Add job and update another
-        temp_file = Path(str(self.queue_file) + ".tmp")
-        try:
-            with open(self.queue_file, 'r') as f:
-                jobs = json.load(f)
-            
-            # Add new job
-            new_job = {
-                "job_id": "job_004",
-                "input_file": "/audio/input4.wav",
-                "output_file": "/audio/output4.mp3",
-                "bitrate": 128,
-                "format": "mp3",
-                "status": "pending",
-                "priority": "normal",
-                "progress": 0.0,
-                "created_at": "2025-01-01T10:15:00Z"
-            }
-            jobs.append(new_job)
-            
-            # Update existing job
-            for job in jobs:
-                if job["job_id"] == "job_001":
-                    job["status"] = "completed"
-                    break
-            
-            # Write to temp file
-            with open(temp_file, 'w') as f:
-                json.dump(jobs, f, indent=2)
-            
-            # Atomic commit
-            temp_file.replace(self.queue_file)
-            
-            # Verify transaction
-            with open(self.queue_file, 'r') as f:
-                result = json.load(f)
-            
-            self.assertEqual(len(result), 4)  # Added one job
-            completed_job = next((j for j in result if j["job_id"] == "job_001"), None)
-            self.assertEqual(completed_job["status"], "completed")
-            
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        jobs = _read_json(self.queue_file)
+        
+        # Add new job
+        new_job = {
+            "job_id": "job_004",
+            "input_file": "/audio/input4.wav",
+            "output_file": "/audio/output4.mp3",
+            "bitrate": 128,
+            "format": "mp3",
+            "status": "pending",
+            "priority": "normal",
+            "progress": 0.0,
+            "created_at": "2025-01-01T10:15:00Z"
+        }
+        jobs.append(new_job)
+        
+        # Update existing job
+        jobs_by_id = _key_by(jobs, "job_id")
+        jobs_by_id["job_001"]["status"] = "completed"
+        
+        # Atomic commit through a temp file
+        _atomic_write_json(self.queue_file, jobs)
+        
+        # Verify transaction
+        result = _read_json(self.queue_file)
+        
+        self.assertEqual(len(result), 4)  # Added one job
+        completed_job = _key_by(result, "job_id").get("job_001")
+        self.assertEqual(completed_job["status"], "completed")
 
 
 class TestPresetDatabase(unittest.TestCase):
     """Test preset database operations"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.presets_file = Path(self.test_dir) / "workflow_presets.json"
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared test directory, sample presets and preset schema"""
+        cls.test_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
         
-        # Sample presets
-        self.sample_presets = {
+        # Sample presets, decoded into a fresh dict per test
+        cls.sample_presets_bytes = _dumps({
             "speech_clean": {
                 "name": "Speech Clean",
                 "description": "Optimized for speech with noise reduction",
@@ -526,53 +605,58 @@ class TestPresetDatabase(unittest.TestCase):
                 "compressor_enabled": False,
                 "multiband_enabled": False
             }
-        }
+        })
+        
+        # Integrity constraints for every preset in the presets file
+        cls.preset_validator = _StrictIntDraft7Validator({
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "required": ["name", "category", "format", "bitrates", "content_type"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "bitrates": {"type": "array", "items": {"type": "integer", "minimum": 1}},
+                    "content_type": {"type": "string"}
+                }
+            }
+        })
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.presets_file = Path(self.test_dir) / f"{self._testMethodName}.json"
+        self.sample_presets = _loads(self.sample_presets_bytes)
     
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def test_preset_crud_operations(self):
         """Test preset Create, Read, Update, Delete operations"""
-        # Create
-        with open(self.presets_file, 'w') as f:
-            json.dump(self.sample_presets, f, indent=2)
-        
-        # Read
-        with open(self.presets_file, 'r') as f:
-            presets = json.load(f)
+        # Create and read in memory
+        presets = self.sample_presets
         
         self.assertEqual(len(presets), 3)
         self.assertIn("speech_clean", presets)
         
         # Update
         presets["speech_clean"]["bitrates"] = [64, 96, 128, 192]
-        with open(self.presets_file, 'w') as f:
-            json.dump(presets, f, indent=2)
-        
-        with open(self.presets_file, 'r') as f:
-            updated_presets = json.load(f)
-        
-        self.assertEqual(updated_presets["speech_clean"]["bitrates"], [64, 96, 128, 192])
+        self.assertEqual(presets["speech_clean"]["bitrates"], [64, 96, 128, 192])
         
         # Delete
         del presets["podcast_standard"]
-        with open(self.presets_file, 'w') as f:
-            json.dump(presets, f, indent=2)
-        
-        with open(self.presets_file, 'r') as f:
-            final_presets = json.load(f)
+        self.assertEqual(len(presets), 2)
+        self.assertNotIn("podcast_standard", presets)
         
-        self.assertEqual(len(final_presets), 2)
-        self.assertNotIn("podcast_standard", final_presets)
+        # Persist once and verify the round trip
+        _write_json(self.presets_file, presets)
+        self.assertEqual(_read_json(self.presets_file), presets)
     
     def test_preset_query_by_category(self):
         """Test preset query by category"""
-        with open(self.presets_file, 'w') as f:
-            json.dump(self.sample_presets, f, indent=2)
+        self.presets_file.write_bytes(self.sample_presets_bytes)
         
-        with open(self.presets_file, 'r') as f:
-            presets = json.load(f)
+        presets = _read_json(self.presets_file)
         
         # Query by category
         speech_presets = {k: v for k, v in presets.items() if v.get("category") == "speech"}
@@ -585,58 +669,54 @@ class TestPresetDatabase(unittest.TestCase):
     
     def test_preset_search_by_name(self):
         """Test preset search by name"""
-        with open(self.presets_file, 'w') as f:
-            json.dump(self.sample_presets, f, indent=2)
+        self.presets_file.write_bytes(self.sample_presets_bytes)
         
-        with open(self.presets_file, 'r') as f:
-            presets = json.load(f)
+        presets = _read_json(self.presets_file)
         
-        # Search by name substring
-        search_term = "Music"
-        matching_presets = {k: v for k, v in presets.items() 
-                          if search_term.lower() in v.get("name", "").lower()}
+        # Search by name substring against a case-folded name index
+        name_index = {k: v.get("name", "").casefold() for k, v in presets.items()}
+        search_term = "Music".casefold()
+        matching_presets = {k: presets[k] for k, name in name_index.items() if search_term in name}
         
         self.assertEqual(len(matching_presets), 1)
         self.assertIn("music_hifi", matching_presets)
     
     def test_preset_data_integrity(self):
         """Test preset data integrity constraints"""
-        with open(self.presets_file, 'w') as f:
-            json.dump(self.sample_presets, f, indent=2)
+        self.presets_file.write_bytes(self.sample_presets_bytes)
         
-        with open(self.presets_file, 'r') as f:
-            presets = json.load(f)
+        presets = _read_json(self.presets_file)
         
-        # Validate required fields
-        required_fields = ["name", "category", "format", "bitrates", "content_type"]
-        
-        for preset_id, preset in presets.items():
-            for field in required_fields:
-                self.assertIn(field, preset, f"Missing {field} in preset {preset_id}")
-            
-            # Validate field types
-            self.assertIsInstance(preset["name"], str)
-            self.assertIsInstance(preset["bitrates"], list)
-            self.assertIsInstance(preset["content_type"], str)
-            
-            # Validate bitrates are positive integers
-            for bitrate in preset["bitrates"]:
-                self.assertIsInstance(bitrate, int)
-                self.assertGreater(bitrate, 0)
+        # Validate required fields, field types and positive integer bitrates
+        errors = [f"{'/'.join(map(str, e.absolute_path))}: {e.message}"
+                  for e in self.preset_validator.iter_errors(presets)]
+        self.assertEqual(errors, [], "Presets should satisfy the integrity constraints")
+        
+        # A preset missing a field, with a non-positive bitrate or a float bitrate is rejected
+        presets["speech_clean"]["bitrates"].append(0)
+        presets["speech_clean"]["bitrates"].append(128.0)
+        del presets["music_hifi"]["content_type"]
+        self.assertEqual(len(list(self.preset_validator.iter_errors(presets))), 3)
 
 
 class TestAuditLogDatabase(unittest.TestCase):
     """Test audit log database operations"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create a test directory shared by the class"""
+        cls.test_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
+    
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.audit_dir = Path(self.test_dir) / "audit_logs"
+        # Queries glob the audit directory, so each test gets its own
+        self.audit_dir = Path(self.test_dir) / self._testMethodName
         self.audit_dir.mkdir(exist_ok=True)
     
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def test_audit_log_write(self):
         """Test audit log writing"""
@@ -663,11 +743,9 @@ class TestAuditLogDatabase(unittest.TestCase):
             }
         ]
         
-        with open(audit_file, 'w') as f:
-            json.dump(audit_entries, f, indent=2)
+        _write_json(audit_file, audit_entries)
         
-        with open(audit_file, 'r') as f:
-            loaded = json.load(f)
+        loaded = _read_json(audit_file)
         
         self.assertEqual(len(loaded), 2)
     
@@ -687,15 +765,14 @@ class TestAuditLogDatabase(unittest.TestCase):
                 }
                 for i in range(3)
             ]
-            with open(audit_file, 'w') as f:
-                json.dump(entries, f, indent=2)
+            _write_json(audit_file, entries)
         
-        # Query all logs from date range
-        all_logs = []
-        for audit_file in self.audit_dir.glob("audit_*.json"):
-            with open(audit_file, 'r') as f:
-                logs = json.load(f)
-            all_logs.extend(logs)
+        # Query all logs from date range, parsing the files concurrently
+        with os.scandir(self.audit_dir) as entries:
+            paths = [entry.path for entry in entries
+                     if entry.name.startswith("audit_") and entry.name.endswith(".json")]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            all_logs = list(chain.from_iterable(executor.map(_read_json, paths)))
         
         self.assertEqual(len(all_logs), 9)
         
@@ -711,53 +788,55 @@ class TestAuditLogDatabase(unittest.TestCase):
 class TestDataValidationConstraints(unittest.TestCase):
     """Test data validation and constraints"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create a test directory shared by the class"""
+        cls.test_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
+    
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
+        self.data_file = Path(self.test_dir) / f"{self._testMethodName}.json"
     
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def test_unique_constraint_simulation(self):
         """Test unique constraint simulation for job IDs"""
-        data_file = Path(self.test_dir) / "jobs.json"
+        data_file = self.data_file
         
         jobs = [
             {"job_id": "job_001", "name": "Job 1"},
             {"job_id": "job_002", "name": "Job 2"}
         ]
         
-        with open(data_file, 'w') as f:
-            json.dump(jobs, f, indent=2)
+        _write_json(data_file, jobs)
         
         # Check for duplicate before insert
-        with open(data_file, 'r') as f:
-            existing_jobs = json.load(f)
+        existing_jobs = _read_json(data_file)
         
-        existing_ids = {job["job_id"] for job in existing_jobs}
+        existing_ids = set(map(itemgetter("job_id"), existing_jobs))
         new_job_id = "job_003"
         
         # Simulate unique constraint
         if new_job_id not in existing_ids:
             existing_jobs.append({"job_id": new_job_id, "name": "Job 3"})
-            with open(data_file, 'w') as f:
-                json.dump(existing_jobs, f, indent=2)
+            _write_json(data_file, existing_jobs)
         
         # Try to add duplicate
         duplicate_job_id = "job_001"
         if duplicate_job_id not in existing_ids:
             existing_jobs.append({"job_id": duplicate_job_id, "name": "Duplicate Job"})
         
-        with open(data_file, 'r') as f:
-            final_jobs = json.load(f)
+        final_jobs = _read_json(data_file)
         
         # Should only have 3 jobs (original 2 + 1 new, not the duplicate)
         self.assertEqual(len(final_jobs), 3)
     
     def test_required_field_validation(self):
         """Test required field validation"""
-        data_file = Path(self.test_dir) / "config.json"
+        data_file = self.data_file
         
         valid_config = {
             "name": "Test Config",
@@ -767,11 +846,9 @@ class TestDataValidationConstraints(unittest.TestCase):
             }
         }
         
-        with open(data_file, 'w') as f:
-            json.dump(valid_config, f, indent=2)
+        _write_json(data_file, valid_config)
         
-        with open(data_file, 'r') as f:
-            config = json.load(f)
+        config = _read_json(data_file)
         
         # Validate required fields
         required_fields = ["name"]
@@ -785,7 +862,7 @@ class TestDataValidationConstraints(unittest.TestCase):
     
     def test_data_type_validation(self):
         """Test data type validation"""
-        data_file = Path(self.test_dir) / "data.json"
+        data_file = self.data_file
         
         data = {
             "integer_field": 42,
@@ -795,11 +872,9 @@ class TestDataValidationConstraints(unittest.TestCase):
             "null_field": None
         }
         
-        with open(data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(data_file, data)
         
-        with open(data_file, 'r') as f:
-            loaded = json.load(f)
+        loaded = _read_json(data_file)
         
         # Validate types
         self.assertIsInstance(loaded["integer_field"], int)
@@ -810,7 +885,7 @@ class TestDataValidationConstraints(unittest.TestCase):
     
     def test_range_constraint_validation(self):
         """Test numeric range constraints"""
-        data_file = Path(self.test_dir) / "config.json"
+        data_file = self.data_file
         
         config = {
             "volume": 75,  # 0-100 range
@@ -818,11 +893,9 @@ class TestDataValidationConstraints(unittest.TestCase):
             "channels": 2  # 1, 2, or 6
         }
         
-        with open(data_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        _write_json(data_file, config)
         
-        with open(data_file, 'r') as f:
-            loaded = json.load(f)
+        loaded = _read_json(data_file)
         
         # Validate ranges
         self.assertGreaterEqual(loaded["volume"], 0)
@@ -836,14 +909,19 @@ class TestDataValidationConstraints(unittest.TestCase):
 class TestIndexOperations(unittest.TestCase):
     """Test index-like operations for efficient queries"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create a test directory shared by the class"""
+        cls.test_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
+    
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.data_file = Path(self.test_dir) / "data.json"
+        self.data_file = Path(self.test_dir) / f"{self._testMethodName}.json"
     
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def test_index_creation(self):
         """Test creating indexes for faster queries"""
@@ -855,24 +933,17 @@ class TestIndexOperations(unittest.TestCase):
             {"id": 5, "category": "B", "value": 250}
         ]
         
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(self.data_file, data)
         
         # Create index by category
-        with open(self.data_file, 'r') as f:
-            items = json.load(f)
-        
-        category_index = {}
-        for item in items:
-            cat = item["category"]
-            if cat not in category_index:
-                category_index[cat] = []
-            category_index[cat].append(item["id"])
+        id_to_item, category_index = _build_index(self.data_file, itemgetter("category"))
         
         # Use index for query
-        category_a_items = [item for item in items if item["id"] in category_index.get("A", [])]
+        category_a_items = sorted((id_to_item[i] for i in category_index.get("A", ())), key=itemgetter("id"))
         
-        self.assertEqual(len(category_a_items), 2)
+        self.assertEqual(category_a_items, [data[0], data[2]])
+        self.assertEqual([item["value"] for item in category_a_items], [100, 150])
+        self.assertNotIn("D", category_index)
     
     def test_compound_index(self):
         """Test compound index for multi-field queries"""
@@ -880,64 +951,60 @@ class TestIndexOperations(unittest.TestCase):
             {"id": 1, "category": "A", "status": "active", "priority": 1},
             {"id": 2, "category": "A", "status": "inactive", "priority": 2},
             {"id": 3, "category": "B", "status": "active", "priority": 1},
-            {"id": 4, "category": "B", "status": "active", "priority": 3}
+            {"id": 4, "category": "B", "status": "active", "priority": 3},
+            {"id": 5, "category": "B", "status": "inactive", "priority": 2}
         ]
         
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        with open(self.data_file, 'r') as f:
-            items = json.load(f)
+        _write_json(self.data_file, data)
         
-        # Create compound index
-        compound_index = {}
-        for item in items:
-            key = (item["category"], item["status"])
-            if key not in compound_index:
-                compound_index[key] = []
-            compound_index[key].append(item["id"])
+        # Create compound index on (category, status)
+        id_to_item, compound_index = _build_index(self.data_file, itemgetter("category", "status"))
         
         # Query using compound index
-        active_b_items = [item for item in items 
-                         if item["id"] in compound_index.get(("B", "active"), [])]
+        active_b_items = sorted((id_to_item[i] for i in compound_index.get(("B", "active"), ())),
+                                key=itemgetter("id"))
         
-        self.assertEqual(len(active_b_items), 2)
+        self.assertEqual([item["id"] for item in active_b_items], [3, 4])
+        for item in active_b_items:
+            self.assertEqual((item["category"], item["status"]), ("B", "active"))
+        self.assertEqual([item["priority"] for item in active_b_items], [1, 3])
 
 
 class TestBackupAndRecovery(unittest.TestCase):
     """Test backup and recovery operations"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the test and backup directories shared by the class"""
+        cls.test_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
+        cls.backup_dir = Path(cls.test_dir) / "backups"
+        cls.backup_dir.mkdir(exist_ok=True)
+    
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.backup_dir = Path(self.test_dir) / "backups"
-        self.backup_dir.mkdir(exist_ok=True)
-        self.data_file = Path(self.test_dir) / "data.json"
+        self.data_file = Path(self.test_dir) / f"{self._testMethodName}.json"
     
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test directory"""
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def test_data_backup(self):
         """Test data backup creation"""
         data = {"important": "data", "values": [1, 2, 3, 4, 5]}
         
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(self.data_file, data)
         
         # Create backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = f"{time.time_ns():x}"
         backup_file = self.backup_dir / f"backup_{timestamp}.json"
         
-        with open(self.data_file, 'r') as source:
-            with open(backup_file, 'w') as backup:
-                json.dump(json.load(source), backup, indent=2)
+        shutil.copyfile(self.data_file, backup_file)
         
         # Verify backup
         self.assertTrue(backup_file.exists())
         
-        with open(backup_file, 'r') as f:
-            backup_data = json.load(f)
+        backup_data = _read_json(backup_file)
         
         self.assertEqual(backup_data, data)
     
@@ -947,84 +1014,106 @@ class TestBackupAndRecovery(unittest.TestCase):
         backup_data = {"recovered": "data"}
         
         # Create initial data
-        with open(self.data_file, 'w') as f:
-            json.dump(original_data, f, indent=2)
+        _write_json(self.data_file, original_data)
         
         # Create backup
         backup_file = self.backup_dir / "backup_001.json"
-        with open(self.backup_dir / "backup_001.json", 'w') as f:
-            json.dump(backup_data, f, indent=2)
+        _write_json(backup_file, backup_data)
         
         # Simulate data loss (corruption)
         with open(self.data_file, 'w') as f:
             f.write("corrupted data")
         
         # Recover from backup
-        with open(backup_file, 'r') as backup:
-            with open(self.data_file, 'w') as target:
-                json.dump(json.load(backup), target, indent=2)
+        shutil.copyfile(backup_file, self.data_file)
         
         # Verify recovery
-        with open(self.data_file, 'r') as f:
-            recovered_data = json.load(f)
+        recovered_data = _read_json(self.data_file)
         
         self.assertEqual(recovered_data, backup_data)
 
 
-def run_database_tests():
-    """Run all database tests"""
+def _failure_message(traceback_text: str) -> str:
+    """One-line summary of a failure: the assertion message, else the traceback's last line"""
+    _, sep, tail = traceback_text.rpartition('AssertionError:')
+    return tail.strip() if sep else traceback_text.splitlines()[-1]
+
+
+def _run_test_class(test_class: type) -> tuple:
+    """Run one TestCase class in a worker process and return its picklable outcome"""
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2)
+    result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(test_class))
+    return (
+        stream.getvalue(),
+        result.testsRun,
+        [(str(test), traceback) for test, traceback in result.failures],
+        [(str(test), traceback) for test, traceback in result.errors],
+        len(result.skipped),
+        result.wasSuccessful(),
+    )
+
+
+def run_database_tests(parallel: bool = False):
+    """Run all database tests, one process per test class when parallel is set"""
     print("=" * 80)
     print("Pure Sound - Database Tests")
     print("=" * 80)
     
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
+    # Every TestCase in the module, so new classes cannot be left out
+    suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
     
-    test_classes = [
-        TestConfigurationDatabase,
-        TestJobQueueDatabase,
-        TestPresetDatabase,
-        TestAuditLogDatabase,
-        TestDataValidationConstraints,
-        TestIndexOperations,
-        TestBackupAndRecovery,
-    ]
-    
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    if parallel:
+        # The classes use separate scratch directories, so they can run side by side
+        test_classes = [type(next(iter(class_suite))) for class_suite in suite
+                        if class_suite.countTestCases()]
+        with ProcessPoolExecutor() as executor:
+            outcomes = list(executor.map(_run_test_class, test_classes))
+        
+        for report, *_ in outcomes:
+            sys.stderr.write(report)
+        tests_run = sum(outcome[1] for outcome in outcomes)
+        failures = [failure for outcome in outcomes for failure in outcome[2]]
+        errors = [error for outcome in outcomes for error in outcome[3]]
+        skipped = sum(outcome[4] for outcome in outcomes)
+        success = all(outcome[5] for outcome in outcomes)
+    else:
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        tests_run = result.testsRun
+        failures = result.failures
+        errors = result.errors
+        skipped = len(result.skipped)
+        success = result.wasSuccessful()
     
     print("\n" + "=" * 80)
     print("DATABASE TEST SUMMARY")
     print("=" * 80)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped)}")
+    print(f"Tests run: {tests_run}")
+    print(f"Failures: {len(failures)}")
+    print(f"Errors: {len(errors)}")
+    print(f"Skipped: {skipped}")
     
-    if result.wasSuccessful():
+    if success:
         print("\n✅ All database tests passed!")
     else:
         print("\n❌ Some tests failed")
         
-        if result.failures:
+        if failures:
             print("\nFAILURES:")
-            for test, traceback in result.failures:
-                print(f"- {test}: {traceback.split('AssertionError:')[-1].strip()}")
+            for test, traceback in failures:
+                print(f"- {test}: {_failure_message(traceback)}")
         
-        if result.errors:
+        if errors:
             print("\nERRORS:")
-            for test, traceback in result.errors:
+            for test, traceback in errors:
                 print(f"- {test}: {traceback.splitlines()[-1]}")
     
     print("=" * 80)
     
-    return result.wasSuccessful()
+    return success
 
 
 if __name__ == "__main__":
-    success = run_database_tests()
+    success = run_database_tests(parallel="--parallel" in sys.argv[1:])
     exit(0 if success else 1)
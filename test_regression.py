@@ -16,7 +16,6 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
-from unittest.mock import Mock
 
 
 class TestCoreFunctionalityRegression(unittest.TestCase):
@@ -338,6 +337,9 @@ class TestSecurityRegression(unittest.TestCase):
         
         self.assertIsNotNone(log_id)
         self.assertGreater(len(log_id), 10)
+        
+        # Write buffered entries before the test directory is removed
+        logger.flush()
 
 
 class TestEventSystemRegression(unittest.TestCase):
@@ -411,16 +413,19 @@ class TestDependencyInjectionRegression(unittest.TestCase):
         """Regression test: Service registration should work"""
         from di_container import di_container
         
+        class StubService:
+            pass
+        
         # Create test service
-        test_service = Mock()
+        test_service = StubService()
         
         # Register service
-        di_container.register_instance(Mock, test_service)
+        di_container.register_instance(StubService, test_service)
         
         # Retrieve service
-        retrieved_service = di_container.get_service(Mock)
+        retrieved_service = di_container.get_service(StubService)
         self.assertIsNotNone(retrieved_service)
-        self.assertEqual(retrieved_service, test_service)
+        self.assertIs(retrieved_service, test_service)
 
 
 class TestAPIRegression(unittest.TestCase):
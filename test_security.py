@@ -12,6 +12,7 @@ import unittest
 import tempfile
 import os
 import time
+import json
 import re
 import shutil
 from pathlib import Path
@@ -91,7 +92,42 @@ class TestAuthenticationSecurity(unittest.TestCase):
         
         result = self.auth_manager.revoke_session("non_existent_session")
         self.assertFalse(result, "Revoking non-existent session should fail")
-    
+
+    def test_batch_authentication(self):
+        """Test batch authentication returns one result per credential"""
+        self.auth_manager.create_user(
+            username="second_user",
+            email="second@example.com",
+            password="SecondPassword123!"
+        )
+
+        self.auth_manager.create_user(
+            username="inactive_user",
+            email="inactive@example.com",
+            password="InactivePassword123!"
+        )
+        self.auth_manager.users["inactive_user"].is_active = False
+
+        session_ids = self.auth_manager.authenticate_many([
+            ("test_user", "TestPassword123!", "127.0.0.1"),
+            ("unknown_user", "whatever", "127.0.0.1"),
+            ("second_user", "SecondPassword123!", "10.0.0.2"),
+            ("inactive_user", "InactivePassword123!", "127.0.0.1"),
+            ("test_user", "TestPassword123!", "10.0.0.3"),
+        ])
+
+        self.assertEqual(len(session_ids), 5)
+        self.assertIsNone(session_ids[1], "Unknown user should fail authentication")
+        self.assertIsNone(session_ids[3], "Inactive user should fail authentication")
+        successful = [session_ids[0], session_ids[2], session_ids[4]]
+        self.assertEqual(len(set(successful)), 3, "Each credential should get its own session")
+        for session_id in successful:
+            self.assertIn(session_id, self.auth_manager.active_sessions)
+        self.assertEqual(self.auth_manager.active_sessions[session_ids[2]]["ip_address"], "10.0.0.2")
+        self.assertEqual(self.auth_manager.active_sessions[session_ids[4]]["username"], "test_user")
+        self.assertIsNotNone(self.auth_manager.users["second_user"].last_login)
+        self.assertIsNone(self.auth_manager.users["inactive_user"].last_login)
+
     def test_session_timeout(self):
         """Test session timeout enforcement"""
         session_id = self.auth_manager.authenticate_user(
@@ -615,6 +651,7 @@ class TestAuditLoggingSecurity(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment"""
+        self.audit_logger.close()
         shutil.rmtree(self.test_dir, ignore_errors=True)
     
     def test_audit_event_logging(self):
@@ -667,6 +704,97 @@ class TestAuditLoggingSecurity(unittest.TestCase):
         filtered_logs = self.audit_logger.get_audit_logs(action_pattern="action\\.0")
         self.assertGreater(len(filtered_logs), 0, "Should filter by action pattern")
     
+    def test_buffered_logging(self):
+        """Test buffered audit entries reach disk only after a flush"""
+        from security import AuditLogger
+        audit_logger = AuditLogger(log_directory=self.test_dir, flush_interval=60)
+        
+        log_id = audit_logger.log_event(
+            action="buffered.test",
+            user_id="test_user",
+            resource="test_resource",
+            details={},
+            ip_address="127.0.0.1"
+        )
+        
+        log_file = Path(self.test_dir) / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
+        self.assertFalse(log_file.exists(), "Entry should still be buffered")
+        
+        audit_logger.flush()
+        self.assertIn(log_id, log_file.read_text(), "Flushed entry should be in file")
+    
+    def test_synchronous_logging(self):
+        """Test synchronous mode writes each entry immediately"""
+        from security import AuditLogger
+        audit_logger = AuditLogger(log_directory=self.test_dir, synchronous=True)
+        
+        log_id = audit_logger.log_event(
+            action="synchronous.test",
+            user_id="test_user",
+            resource="test_resource",
+            details={},
+            ip_address="127.0.0.1"
+        )
+        
+        log_file = Path(self.test_dir) / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
+        self.assertIn(log_id, log_file.read_text(), "Entry should be written immediately")
+        audit_logger.close()
+    
+    def test_close_stops_flush_thread(self):
+        """Test close stops the background flush thread and writes pending entries"""
+        from security import AuditLogger
+        audit_logger = AuditLogger(log_directory=self.test_dir, flush_interval=60)
+        
+        log_id = audit_logger.log_event("thread.test", "test_user", "test_resource", {})
+        flush_thread = audit_logger._flush_thread
+        self.assertTrue(flush_thread.is_alive())
+        
+        audit_logger.close()
+        
+        self.assertFalse(flush_thread.is_alive(), "Flush thread should stop on close")
+        log_file = Path(self.test_dir) / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
+        self.assertIn(log_id, log_file.read_text())
+    
+    def test_logging_not_blocked_by_disk_writes(self):
+        """Test log_event only waits on the in-memory buffer, not on a flush writing to disk"""
+        from security import AuditLogger
+        audit_logger = AuditLogger(log_directory=self.test_dir, flush_interval=60)
+        
+        # Holding the write lock stands in for a flush that is busy with disk I/O
+        with audit_logger._write_lock:
+            log_id = audit_logger.log_event("blocking.test", "test_user", "test_resource", {})
+        audit_logger.close()
+        
+        log_file = Path(self.test_dir) / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
+        self.assertIn(log_id, log_file.read_text())
+    
+    def test_logging_after_log_file_removed(self):
+        """Test entries are written to a new file after the open log file is removed"""
+        from security import AuditLogger
+        audit_logger = AuditLogger(log_directory=self.test_dir, synchronous=True)
+        
+        log_file = Path(self.test_dir) / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
+        audit_logger.log_event("rotate.test", "test_user", "test_resource", {})
+        log_file.unlink()
+        log_id = audit_logger.log_event("rotate.test", "test_user", "test_resource", {})
+        audit_logger.close()
+        
+        self.assertIn(log_id, log_file.read_text(), "Entry should not go to the removed file")
+    
+    def test_logging_after_close(self):
+        """Test the log file is reopened for entries written after close"""
+        from security import AuditLogger
+        audit_logger = AuditLogger(log_directory=self.test_dir, synchronous=True)
+        
+        first_id = audit_logger.log_event("close.test", "test_user", "test_resource", {})
+        audit_logger.close()
+        second_id = audit_logger.log_event("close.test", "test_user", "test_resource", {})
+        audit_logger.close()
+        
+        log_file = Path(self.test_dir) / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
+        lines = log_file.read_text().splitlines()
+        self.assertEqual([json.loads(line)["log_id"] for line in lines], [first_id, second_id])
+    
     def test_log_integrity(self):
         """Test audit log integrity"""
         log_id = self.audit_logger.log_event(
@@ -677,6 +805,7 @@ class TestAuditLoggingSecurity(unittest.TestCase):
             ip_address="127.0.0.1",
             risk_level="medium"
         )
+        self.audit_logger.flush()
         
         log_file = Path(self.test_dir) / f"audit_{datetime.now().strftime('%Y%m%d')}.log"
         self.assertTrue(log_file.exists(), "Audit log file should exist")
@@ -224,6 +224,9 @@ def test_audit_logger():
         
         assert log_id is not None, "Log should return ID"
         assert len(log_id) > 10, "Log ID should be sufficiently long"
+        
+        # Write buffered entries before the temp directory is removed
+        logger.flush()
     finally:
         # Cleanup
         import shutil
@@ -269,15 +272,16 @@ def test_di_container():
     assert di_container is not None, "DI container should exist"
     
     # Test service registration
-    from unittest.mock import Mock
+    class StubService:
+        pass
     
-    test_service = Mock()
-    di_container.register_instance(Mock, test_service)
+    test_service = StubService()
+    di_container.register_instance(StubService, test_service)
     
     # Test service retrieval
-    retrieved = di_container.get_service(Mock)
+    retrieved = di_container.get_service(StubService)
     assert retrieved is not None, "Should retrieve service"
-    assert retrieved == test_service, "Should return same service"
+    assert retrieved is test_service, "Should return same service"
 
 
 @smoke_test(